@@ -21,8 +21,29 @@
 #  time spent here.
 #  Relevant employers or funding agencies will be notified accordingly.
 
-from .content.data import Data
-from .content.root import Root
-from .content.creation import new
-from .step.dataset import dataset
-from .step.file import file
+from importlib import import_module
+
+# Public names are resolved on first access, so that 'import aiuna' does not pull heavy dependencies
+# (sklearn, pandas, liac-arff, lz4, zstandard, ...) nor build the default dataset/file steps.
+_modules = {
+    "Data": "aiuna.content.data",
+    "Root": "aiuna.content.root",
+    "new": "aiuna.content.creation",
+    "dataset": "aiuna.step.dataset",
+    "file": "aiuna.step.file",
+    "files": "aiuna.step.file",
+    "freeze": "aiuna.content.hashing",
+}
+__all__ = list(_modules)
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError(f"module 'aiuna' has no attribute '{name}'")
+    value = getattr(import_module(_modules[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
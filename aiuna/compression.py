@@ -22,34 +22,112 @@
 #  Relevant employers or funding agencies will be notified accordingly.
 
 
+
 import _pickle as pickle
-import json
-import orjson as orjson
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from random import random
+from os import listdir
+from os.path import dirname, exists, join
+from threading import Lock, local
 
 import lz4.frame as lz
 import numpy as np
+import orjson as orjson
 import zstandard as zs
+
+from aiuna import filters
+from aiuna.content.hashing import own, strcodes
+
+# Container layout: VERSION byte, kind byte, payload.
+#   A: ndarray, 4-byte little-endian header length, JSON header (dtype, shape, codec, filter, block, sizes),
+#      codec and filter being chosen per field by sampling,
+#      raw buffer split into blocks of fixed size filtered and compressed independently and concatenated
+#   J: JSON-serializable values, zstd-compressed orjson using the metadata dictionary
+#   T: str, zstd-compressed utf-8 using the metadata dictionary
+#   B: bytes, lz4 (+ zstd) compressed
+#   L: labels (str or object arrays of few distinct strings), 4-byte header length, JSON header (dtype, shape,
+#      categories, bits), then the codes bit-packed with the given number of bits each, zstd compressed
+#   P: anything else, zstd-compressed pickle
+# Dumps not starting with VERSION are legacy plain orjson.
+# Streams written by dump() have kind S: 4-byte header length, JSON header, then frames of a 4-byte length followed
+# by one compressed block (arrays) or the whole pack() output (other objects).
+VERSION = b"\xa1"
+CODEC = "zstd"
+LEVEL = 3
+DICTIONARIES = join(dirname(__file__), "assets", "zstd")
+# Directories where dictionaries are looked up: the shipped ones first, then those given in AIUNA_ZSTD_DICT_PATH.
+DICT_DIRS = [DICTIONARIES] + [d for d in os.environ.get("AIUNA_ZSTD_DICT_PATH", "").split(os.pathsep) if d]
+# Dictionary used to compress metadata (0: none). Others are only used to decompress the dumps that name them, so
+# a retrained dictionary is only used when pinned here, and must be available wherever its dumps are read.
+DICT_ID = int(os.environ.get("AIUNA_ZSTD_DICT", 1))
+DICT_SIZE = 2 ** 16
+BLOCK_BYTES = 2 ** 22  # arrays are compressed in independent blocks of this size
+THREADS = os.cpu_count() or 1
+ALIGNMENT = 64  # array payloads and decompression buffers start at multiples of this many bytes
+# Packing policy: bandwidth in bytes/s at which fields are expected to be fetched, None to minimize size only.
+POLICIES = {"fastest": 2 ** 31, "balanced": 2 ** 27, "smallest": None}
+POLICY = os.environ.get("AIUNA_PACK_POLICY", "balanced")
+CODECS = ["zstd", "lz4", "raw"]
+SPEED = {"raw": float("inf"), "lz4": 2 ** 32, "zstd": 2 ** 30, "none": float("inf"), "shuffle": 2 ** 31, "delta": 2 ** 31,
+         "xor": 2 ** 30}
+SAMPLE_BYTES, SAMPLE_SLICES = 2 ** 16, 4
+MAX_CATEGORIES = 2 ** 16  # label arrays with more distinct values are packed as ordinary arrays
+PACK_CACHE_BUDGET = int(os.environ.get("AIUNA_PACK_CACHE", 2 ** 28))  # bytes of packed fields kept by memopack
+_contexts = local()  # zstd contexts of each thread, see zstd()
+
+
 # Things that should be calculated only once.
 # ##################################################
-from akangatu.transf.config import safety
-# TODO: make a permanent representative dictionary and check if it
-#  reduces compression time and size of textual info like transformations.
-from garoupa.encoders import integers2bytes, bytes2integers
+@lru_cache()
+def compression_dict(dict_id=None):
+    """Zstd dictionary with the given id, found in DICT_DIRS; DICT_ID by default."""
+    dict_id = DICT_ID if dict_id is None else dict_id
+    for dir in DICT_DIRS:
+        filename = join(dir, f"{dict_id}.dict")
+        if exists(filename):
+            with open(filename, "rb") as f:
+                return zs.ZstdCompressionDict(f.read())
+    raise Exception("Unknown compression dictionary:", dict_id)
 
 
-@lru_cache()
-def compression_dict():  # TODO: update dictionary
-    txt_comming_from_a_file_for_training_of_compressor = "aasfdkjgd kajgsdf af kajgakjsg fkajgs df\n" * 653
-    samples = [
-        (str(random()) + s).encode()
-        for s in txt_comming_from_a_file_for_training_of_compressor.split("\n")
-    ]
-    return zs.train_dictionary(dict_size=99999999, samples=samples, threads=-1)
+def dictionary_ids(dirs=None):
+    return [int(f[:-5]) for dir in dirs or DICT_DIRS if exists(dir) for f in listdir(dir) if f.endswith(".dict")]
 
 
-# ##################################################
+def retrain(dumps, dir, dict_id=None, dict_size=DICT_SIZE):
+    """Train a new dictionary from stored dumps of step/history metadata and save it into the given directory.
+
+    Dumps can be in any format understood by unpack(); only lists and dicts (e.g. History.aslist, Leaf.asdict) are used.
+    The new id (by default, the next one after all known dictionaries) is recorded in every zstd frame compressed
+    with it. It is not used for compression unless pinned by AIUNA_ZSTD_DICT (with dir in AIUNA_ZSTD_DICT_PATH).
+    Returns the id of the new dictionary.
+    """
+    samples = []
+    for dump in dumps:
+        obj = unpack(dump)
+        if isinstance(obj, (list, dict)):
+            samples.append(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS))
+    if not samples:
+        raise Exception("No step/history metadata to train the dictionary on.")
+    if dict_id is None:
+        dict_id = max(dictionary_ids(DICT_DIRS + [dir]), default=0) + 1
+    zdict = zs.train_dictionary(dict_size, samples, dict_id=dict_id, threads=-1)
+    os.makedirs(dir, exist_ok=True)
+    with open(join(dir, f"{dict_id}.dict"), "wb") as f:
+        f.write(zdict.as_bytes())
+    compression_dict.cache_clear()
+    return dict_id
+
+
+def build_dictionary(dir=DICTIONARIES):
+    """(Re)generate the shipped dictionary 1 from its synthetic training corpus (see aiuna.corpus).
+
+    Only needed if the corpus changes, which also requires a new id, since dumps name the dictionary they need."""
+    from aiuna.corpus import metadata
+    return retrain(map(orjson.dumps, metadata()), dir, dict_id=1)
+
 
 class HashableBinary:
     def __init__(self, n, obj):
@@ -60,97 +138,408 @@ class HashableBinary:
         return self.n
 
 
+class PackCache:
+    """LRU memo of packed dumps keyed by field UUID, bounded by the total size in bytes of the dumps."""
+
+    def __init__(self, budget=PACK_CACHE_BUDGET):
+        self.budget = budget
+        self.size = self.hits = self.misses = 0
+        self._dumps = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key):
+        with self._lock:
+            dump = self._dumps.get(key)
+            if dump is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._dumps.move_to_end(key)
+            return dump
+
+    def put(self, key, dump):
+        if len(dump) > self.budget:
+            return
+        with self._lock:
+            if key in self._dumps:
+                self.size -= len(self._dumps.pop(key))
+            self._dumps[key] = dump
+            self.size += len(dump)
+            while self.size > self.budget:
+                self.size -= len(self._dumps.popitem(last=False)[1])
+
+    def clear(self):
+        with self._lock:
+            self._dumps.clear()
+            self.size = self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._dumps)
+
+
+packcache = PackCache()
+
+
 def fpack(data, field):
     return memopack(HashableBinary(data.uuids[field].n, data[field]))
 
 
-# ###@lru_cache()
-def memopack(hashable_binary):
-    return pack(hashable_binary.obj)
-
-
-# compression_lock = new_lock()
-
-
-def pack(obj):
-    return orjson.dumps(obj)
-    # cctx = zs.ZstdCompressor(threads=-1)
-    # cctxdic = zs.ZstdCompressor(threads=-1, dict_data=compression_dict(), write_dict_id=False)
-    #
-    # cctxdec = zs.ZstdDecompressor()
-    # cctxdicdec = zs.ZstdDecompressor(dict_data=compression_dict())
-    #
-    # # with safety():
-    # if isinstance(obj, np.ndarray) and str(obj.dtype) == "float64" and len(obj.shape) == 2:
-    #     # X, ...
-    #     h, w = obj.shape
-    #     fast_reduced = lz.compress(obj.reshape(w * h), compression_level=1)
-    #     header = integers2bytes(obj.shape)
-    #     return b"F" + header + cctx.compress(fast_reduced)
-    # elif isinstance(obj, (list, set, str, int, float, bytearray, bool)):
-    #     # steps, ...
-    #     js = json.dumps(obj, sort_keys=True, ensure_ascii=False)
-    #     return b"J" + cctx.compress(js.encode())
-    # elif isinstance(obj, str):
-    #     return b"T" + cctxdic.compress(obj.encode())  # b'T'+0s==1409286144
-    # elif isinstance(obj, bytes):
-    #     fast_reduced = lz.compress(obj, compression_level=1)
-    #     return b"B" + cctx.compress(fast_reduced)
-    # elif callable(obj):
-    #     raise Exception("Cannot compress callable", type(obj))
-    # else:
-    #     # print(f"Unknown type {type(obj)}{'-' + str(obj.dtype) if 'ndarray' in str(type(obj)) else ''} to compress, using pickle...")
-    #     # categorical ndarrays, ...
-    #     pickled = pickle.dumps(obj)  # 1169_airlines explodes here with RAM < ?
-    #     fast_reduced = lz.compress(pickled, compression_level=1)
-    #     return b"P" + cctx.compress(fast_reduced)  # b'P'+0s==1342177280
+def memopack(hashable_binary, cache=packcache):
+    """Pack the object only once for each UUID while its dump fits in the cache."""
+    key = hashable_binary.n
+    dump = cache.get(key)
+    if dump is None:
+        dump = pack(hashable_binary.obj)
+        cache.put(key, dump)
+    return dump
+
+
+def zstd(kind, dict_id=0):
+    """Zstd compressor (kind "c") or decompressor ("d") of the current thread, reused across calls.
+
+    Contexts are not thread-safe, hence one per thread. dict_id=0 means no dictionary."""
+    zdict = None if dict_id == 0 else compression_dict(dict_id)
+    key = kind, dict_id
+    cached = _contexts.__dict__.get(key)
+    if cached is None or cached[0] is not zdict:  # New or retrained dictionary.
+        context = zs.ZstdCompressor(level=LEVEL, dict_data=zdict) if kind == "c" else zs.ZstdDecompressor(dict_data=zdict)
+        cached = _contexts.__dict__[key] = zdict, context
+    return cached[1]
+
+
+def compress(buffer, codec=CODEC, dictionary=False):
+    """Compress a bytes-like object with the named codec ("zstd", "lz4" or "raw").
+
+    With dictionary=True, zstd uses the metadata dictionary (see DICT_ID) and records its id in the frame header."""
+    if codec == "zstd":
+        return zstd("c", DICT_ID if dictionary else 0).compress(buffer)
+    if codec == "lz4":
+        return lz.compress(buffer, compression_level=1)
+    if codec == "raw":
+        return bytes(buffer)
+    raise Exception("Unknown codec:", codec)
+
+
+def decompress(buffer, codec=CODEC):
+    if codec == "zstd":
+        dict_id = zs.get_frame_parameters(buffer).dict_id
+        if dict_id:
+            return zstd("d", dict_id).decompress(buffer)
+        return zstd("d").decompress(buffer)
+    if codec == "lz4":
+        return lz.decompress(buffer)
+    if codec == "raw":
+        return buffer
+    raise Exception("Unknown codec:", codec)
+
+
+def decompress_into(buffer, codec, out):
+    """Decompress straight into the uint8 array out, without intermediate bytes when the codec allows it."""
+    if codec == "zstd" and not zs.get_frame_parameters(buffer).dict_id:
+        view, n = memoryview(out), 0
+        with zstd("d").stream_reader(buffer) as reader:
+            while n < len(out):
+                read = reader.readinto(view[n:])
+                if not read:
+                    raise Exception("Truncated block:", n, "of", len(out), "bytes")
+                n += read
+    else:
+        out[:] = np.frombuffer(decompress(buffer, codec), dtype=np.uint8)
+    return out
+
+
+def aligned(nbytes, alignment=ALIGNMENT):
+    """Uninitialized uint8 array starting at an address multiple of alignment."""
+    buffer = np.empty(nbytes + alignment, dtype=np.uint8)
+    start = -buffer.ctypes.data % alignment
+    return buffer[start:start + nbytes]
+
+
+def choose(a, codec=None, filter=None, policy=None):
+    """Codec and filter for the array according to the policy, by compressing a sample with each candidate.
+
+    The choice minimizes the estimated time to fetch (at the policy bandwidth) and decode the field, or the size for
+    policy "smallest". Speeds come from the fixed SPEED table instead of timings, so the choice (and the dump) is
+    reproducible.
+    """
+    if codec and filter:
+        return codec, filter
+    bandwidth = POLICIES[policy or POLICY]
+    codecs = [codec] if codec else list(CODECS)
+    candidates = [filter] if filter else ["none"] + (["shuffle"] if a.dtype.itemsize > 1 else []) + \
+        (["delta"] if a.dtype.kind in "iu" and a.dtype.itemsize in [2, 4, 8] else []) + \
+        (["xor"] if a.dtype.kind == "f" and a.dtype.itemsize in [2, 4, 8] else [])
+    raw = sample(a.reshape(-1), lag=lag(a.shape)).view(np.uint8)
+    if len(raw) == 0:
+        return codecs[0], candidates[0]
+
+    def cost(choice):
+        c, f = choice
+        size = len(compress(filters.apply(raw, f, a.dtype, lag(a.shape)), c))
+        decoding = len(raw) / SPEED[c] + len(raw) / SPEED[f]
+        return (size, decoding) if bandwidth is None else (size / bandwidth + decoding, size)
+
+    return min(((c, f) for f in candidates for c in codecs), key=cost)
+
+
+def sample(flat, nbytes=None, lag=1):
+    """Evenly spaced slices of whole rows of lag items, about nbytes in total."""
+    nbytes = nbytes or SAMPLE_BYTES
+    if flat.nbytes <= nbytes:
+        return flat
+    items = max(nbytes // SAMPLE_SLICES // flat.itemsize // lag, 1) * lag
+    starts = np.linspace(0, len(flat) // lag - items // lag, SAMPLE_SLICES).astype(int) * lag
+    return np.concatenate([flat[start:start + items] for start in starts])
+
+
+def lag(shape):
+    """Distance in items between consecutive values of a column."""
+    return shape[-1] if len(shape) == 2 and shape[-1] else 1
+
+
+def descr(dtype):
+    """JSON-friendly description of a dtype, keeping the fields of structured dtypes (dtype.str would give |V...)."""
+    return np.lib.format.dtype_to_descr(dtype)
+
+
+def todtype(descr):
+    """Inverse of descr(), after JSON has turned its tuples into lists."""
+    def fields(descr):  # Fields are [name or [title, name], type or nested fields, optional shape].
+        if isinstance(descr, str):
+            return descr
+        return [tuple(fields(x) if i == 1 else tuple(x) if isinstance(x, list) else x for i, x in enumerate(field))
+                for field in descr]
+
+    return np.lib.format.descr_to_dtype(fields(descr))
+
+
+def pack_array(a, codec=None, block_bytes=None, threads=None, filter=None, offset=0, policy=None):
+    """Header and payload of an array split into fixed-size blocks filtered and compressed independently.
+
+    Codec and filter not given are chosen by sampling, see choose().
+    The dump depends only on block_bytes, never on the number of threads.
+    The header is padded so that the payload starts at a multiple of ALIGNMENT counting the offset bytes that will
+    precede the dump, which allows raw payloads to be viewed in place."""
+    if a.dtype.hasobject:
+        raise Exception("Object arrays should be pickled.")
+    a = np.require(a, requirements="C")
+    raw = a.reshape(-1).view(np.uint8)
+    itemsize = max(a.dtype.itemsize, 1)
+    block_bytes = block_bytes or BLOCK_BYTES
+    block_bytes = max(block_bytes - block_bytes % itemsize, itemsize)
+    codec, filter = choose(a, codec, filter, policy)
+    blocks = [raw[i:i + block_bytes] for i in range(0, len(raw), block_bytes)] or [raw]
+    dumps = mapblocks(lambda block: compress(filters.apply(block, filter, a.dtype, lag(a.shape)), codec), blocks, threads)
+    header = orjson.dumps({"dtype": descr(a.dtype), "shape": a.shape, "codec": codec, "filter": filter,
+                           "block": block_bytes, "sizes": [len(dump) for dump in dumps]})
+    header += b" " * (-(offset + 4 + len(header)) % ALIGNMENT)
+    return len(header).to_bytes(4, "little") + header + b"".join(dumps)
+
+
+def unpack_array(dump, threads=None):
+    """Read-only array decompressed into a single aligned buffer.
+
+    Unfiltered raw payloads are returned as a view of the dump itself (e.g. a memory map), without copying."""
+    dump = memoryview(dump)
+    size = int.from_bytes(dump[:4], "little")
+    header = orjson.loads(dump[4:4 + size])
+    dtype, shape = todtype(header["dtype"]), tuple(header["shape"])
+    codec, filter = header["codec"], header.get("filter", "none")
+    payload = dump[4 + size:]
+    if codec == "raw" and filter == "none":
+        out = np.frombuffer(payload, dtype=np.uint8)
+    else:
+        offsets = np.cumsum([0] + header.get("sizes", [len(payload)]))
+        out = aligned(dtype.itemsize * int(np.prod(shape)))
+        step = header.get("block", len(out))
+
+        def f(i):
+            block, target = payload[offsets[i]:offsets[i + 1]], out[i * step:(i + 1) * step]
+            if filter == "none":
+                decompress_into(block, codec, target)
+            else:
+                filters.reverse(np.frombuffer(decompress(block, codec), dtype=np.uint8), filter, dtype, target, lag(shape))
+
+        mapblocks(f, range(len(offsets) - 1), threads)
+        own(out.base)  # Nobody else sees the buffer, so the digest of the field can be cached.
+    out.flags.writeable = False
+    return out.view(dtype).reshape(shape)
+
+
+def mapblocks(f, blocks, threads=None):
+    """Apply f to each block, in parallel when there is more than one; results keep the order of the blocks."""
+    threads = threads or THREADS
+    if len(blocks) <= 1 or threads == 1:
+        return list(map(f, blocks))
+    with ThreadPoolExecutor(min(threads, len(blocks))) as executor:
+        return list(executor.map(f, blocks))
+
+
+def dump(obj, file, codec=None, block_bytes=None, threads=None, filter=None, policy=None):
+    """Write a field to a binary file-like object (file, socket.makefile, ...) in framed blocks.
+
+    Arrays, including memory maps larger than RAM, are read, compressed and written THREADS blocks at a time."""
+    if not isinstance(obj, np.ndarray) or obj.dtype.hasobject:
+        dump = pack(obj)
+        write_frame(file, VERSION + b"S", orjson.dumps({"size": len(dump)}))
+        file.write(dump)
+        return
+    a = np.require(obj, requirements="C")
+    flat = a.reshape(-1)
+    items = max((block_bytes or BLOCK_BYTES) // max(a.dtype.itemsize, 1), 1)
+    codec, filter = choose(a, codec, filter, policy)
+    header = {"dtype": descr(a.dtype), "shape": a.shape, "codec": codec, "filter": filter, "block": items * a.dtype.itemsize}
+    write_frame(file, VERSION + b"S", orjson.dumps(header))
+    threads = threads or THREADS
+    for start in range(0, len(flat), items * threads):
+        blocks = [flat[i:i + items].view(np.uint8) for i in range(start, min(start + items * threads, len(flat)), items)]
+        for block in mapblocks(lambda block: compress(filters.apply(block, filter, a.dtype, lag(a.shape)), codec),
+                               blocks, threads):
+            write_frame(file, b"", block)
+
+
+def load(file, out=None, threads=None):
+    """Read a field written by dump(), keeping at most THREADS compressed blocks in memory.
+
+    Arrays are decompressed into out: a preallocated C-contiguous array, a filename for a new memory map, or None."""
+    if readexactly(file, 2) != VERSION + b"S":
+        raise Exception("Not a stream written by dump().")
+    header = orjson.loads(read_frame(file))
+    if "size" in header:
+        return unpack(readexactly(file, header["size"]))
+    dtype, shape = todtype(header["dtype"]), tuple(header["shape"])
+    if out is None:
+        out = aligned(dtype.itemsize * int(np.prod(shape))).view(dtype).reshape(shape)
+    elif isinstance(out, str):
+        out = np.memmap(out, dtype=dtype, mode="w+", shape=shape)
+    if out.dtype != dtype or out.shape != shape or not out.flags.c_contiguous:
+        raise Exception("Cannot load", dtype, shape, "into", out.dtype, out.shape)
+    raw, step, threads = out.reshape(-1).view(np.uint8), header["block"], threads or THREADS
+    for start in range(0, len(raw), step * threads):
+        blocks = [(i, read_frame(file)) for i in range(start, min(start + step * threads, len(raw)), step)]
+
+        def f(block):
+            i, dump = block
+            target = raw[i:i + step]
+            if header["filter"] == "none":
+                decompress_into(dump, header["codec"], target)
+            else:
+                filters.reverse(np.frombuffer(decompress(dump, header["codec"]), dtype=np.uint8),
+                                header["filter"], dtype, target, lag(shape))
+
+        mapblocks(f, blocks, threads)
+    return out
+
+
+def write_frame(file, prefix, content):
+    file.write(prefix + len(content).to_bytes(4, "little"))
+    file.write(content)
+
+
+def read_frame(file):
+    return readexactly(file, int.from_bytes(readexactly(file, 4), "little"))
+
+
+def readexactly(file, n):
+    buffer = bytearray(n)
+    view, read = memoryview(buffer), 0
+    while read < n:
+        r = file.readinto(view[read:])
+        if not r:
+            raise Exception("Unexpected end of stream:", read, "of", n, "bytes")
+        read += r
+    return buffer
+
+
+def pack_labels(a):
+    """Header and payload of a label array as categories and bit-packed codes, None if it has too many categories."""
+    flat = a.reshape(-1)
+    if a.dtype.kind == "U":
+        categories, codes = np.unique(flat, return_inverse=True)
+        if len(categories) > MAX_CATEGORIES:
+            return None
+        categories = categories.tolist()
+    else:  # Strings and missing values (None, as last category), encoded as for hashing (see hashing.strcodes()).
+        missing = np.equal(flat, None)
+        encoded = strcodes(flat[~missing])
+        if encoded is None:
+            return None
+        categories, codes = encoded[0] + ([None] if missing.any() else []), np.full(len(flat), len(encoded[0]))
+        codes[~missing] = encoded[1]
+        if len(categories) > MAX_CATEGORIES:
+            return None
+    bits = max(int(len(categories) - 1).bit_length(), 1)
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint32)
+    packed = np.packbits(((codes.astype(np.uint32)[:, None] >> shifts) & 1).astype(np.uint8))
+    header = orjson.dumps({"dtype": a.dtype.str, "shape": a.shape, "categories": categories, "bits": bits})
+    return len(header).to_bytes(4, "little") + header + compress(packed)
+
+
+def unpack_labels(dump, codes=False):
+    """Label array, or the pair (categories, codes) if codes=True, e.g. for pandas.Categorical.from_codes."""
+    size = int.from_bytes(dump[:4], "little")
+    header = orjson.loads(dump[4:4 + size])
+    shape, bits = tuple(header["shape"]), header["bits"]
+    n = int(np.prod(shape))
+    unpacked = np.unpackbits(np.frombuffer(decompress(dump[4 + size:]), dtype=np.uint8), count=n * bits)
+    indices = unpacked.reshape(n, bits) @ (1 << np.arange(bits - 1, -1, -1, dtype=np.uint32))
+    indices = indices.astype(np.min_scalar_type(len(header["categories"]))).reshape(shape)
+    out = indices if codes else np.array(header["categories"], dtype=header["dtype"])[indices]
+    own(out)  # Read-only, like any other unpacked array.
+    return (header["categories"], out) if codes else out
+
+
+def pack(obj, policy=None):
+    """Serialize and compress a field value into a self-describing binary dump.
+
+    Arrays are encoded according to the policy (see POLICIES).
+
+    >>> unpack(pack({"a": [1, 2]}))
+    {'a': [1, 2]}
+    """
+    if isinstance(obj, np.ndarray) and (obj.dtype.kind == "U" or obj.dtype.hasobject) and obj.size:
+        # y, decoded nominals, ...
+        dump = pack_labels(obj)
+        if dump is not None:
+            return VERSION + b"L" + dump
+    if isinstance(obj, np.ndarray) and not obj.dtype.hasobject:
+        # X, Y, ...
+        return VERSION + b"A" + pack_array(obj, offset=2, policy=policy)
+    if isinstance(obj, str):
+        return VERSION + b"T" + compress(obj.encode(), dictionary=True)
+    if isinstance(obj, (bytes, bytearray)):
+        return VERSION + b"B" + compress(lz.compress(obj, compression_level=1))
+    if callable(obj):
+        raise Exception("Cannot compress callable", type(obj))
+    if isinstance(obj, (list, dict, int, float, bool)) or obj is None:
+        # steps, history, ...
+        try:
+            return VERSION + b"J" + compress(orjson.dumps(obj, option=orjson.OPT_SORT_KEYS), dictionary=True)
+        except TypeError:
+            pass
+    # object ndarrays, sets, ...
+    return VERSION + b"P" + compress(pickle.dumps(obj))
 
 
 def unpack(dump_with_header):
-    return orjson.loads(dump_with_header)
-    # cctx = zs.ZstdCompressor(threads=-1)
-    # cctxdic = zs.ZstdCompressor(threads=-1, dict_data=compression_dict(), write_dict_id=False)
-    #
-    # cctxdec = zs.ZstdDecompressor()
-    # cctxdicdec = zs.ZstdDecompressor(dict_data=compression_dict())
-    #
-    # # with safety():
-    # header = dump_with_header[:1]
-    # dump = dump_with_header[1:]
-    # if header == b"P":
-    #     decompressed = lz.decompress(cctxdec.decompress(dump))
-    #     return pickle.loads(decompressed)
-    # elif header == b"T":
-    #     return cctxdicdec.decompress(dump).decode()
-    # elif header == b"B":
-    #     return lz.decompress(cctxdec.decompress(dump))
-    # elif header == b"F":
-    #     header = dump_with_header[1:9]
-    #     dump = dump_with_header[9:]
-    #     decompressed = lz.decompress(cctxdec.decompress(dump))
-    #     [h, w] = bytes2integers(header)
-    #     return np.reshape(np.frombuffer(decompressed), newshape=(h, w))
-    # elif header == b"J":
-    #     return json.loads(cctxdec.decompress(dump).decode())
-    # else:
-    #     raise Exception("Unknown compression format:", header, dump[:300])
-
-# def pack_object(obj):  #blosc is buggy
-#     """
-#     Nondeterministic (fast) parallel compression!
-#     Due to multithreading, blosc is nondeterministic and useless for UUIDs.
-#     :param obj:
-#     :return:
-#     """
-#     import blosc
-#     pickled = pickle.dumps(obj)
-#     fast_reduced = lz.compress(pickled, compression_level=1)
-#     return blosc.compress(fast_reduced,
-#                       shuffle=blosc.NOSHUFFLE, cname='zstd', clevel=3)
-
-
-# def unpack_object(dump):  #blosc is buggy
-#     import blosc
-#     decompressed = blosc.decompress(dump)
-#     fast_decompressed = lz.decompress(decompressed)
-#     return pickle.loads(fast_decompressed)
+    """Inverse of pack(); accepts any buffer, e.g. bytes, memoryview or mmap. Arrays come back read-only."""
+    if dump_with_header[:1] != VERSION:
+        return orjson.loads(dump_with_header)
+    kind = dump_with_header[1:2]
+    dump = memoryview(dump_with_header)[2:]
+    if kind == b"A":
+        return unpack_array(dump)
+    if kind == b"L":
+        return unpack_labels(dump)
+    if kind == b"J":
+        return orjson.loads(decompress(dump))
+    if kind == b"T":
+        return decompress(dump).decode()
+    if kind == b"B":
+        return lz.decompress(decompress(dump))
+    if kind == b"P":
+        obj = pickle.loads(decompress(dump))
+        if isinstance(obj, np.ndarray):  # Object arrays: read-only like the other ones.
+            obj.flags.writeable = False
+        return obj
+    raise Exception("Unknown compression format:", kind, bytes(dump[:300]))
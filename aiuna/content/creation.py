@@ -41,27 +41,17 @@
 #  Relevant employers or funding agencies will be notified accordingly.
 
 
-import json
 import math
-from hashlib import md5
+from concurrent.futures import ThreadPoolExecutor
 
-# noinspection PyUnresolvedReferences
-import arff
 import numpy as np
-import sklearn.datasets as ds
 
+from aiuna.content.hashing import columndigests, columnhashes, compose, mathash, own, remember, scheme
+from aiuna.content.parsing import CHUNK_ROWS, SAMPLE_ROWS, opener, read_arff_columns, read_csv_columns, \
+    uncompressed_name
 from akangatu.linalghelper import fields2matrices
 
 
-def mathash(k, v):
-    try:
-        dump = json.dumps(v, sort_keys=True, ensure_ascii=False).encode() if isinstance(v, list) else v.tobytes()
-        return md5(dump).hexdigest()
-    except TypeError as e:
-        print(f"Cannot calculate hash for {k} with value {v}")
-        exit()
-
-
 def hashes_mats(fields):
     """Calculate pseudo-unique hash for each field."""
     matrices = dict(fields2matrices(fields).items())
@@ -69,53 +59,112 @@ def hashes_mats(fields):
 
 
 def new(**fields):
+    """Create a Data object from fields (e.g., X=..., y=...)."""
     from aiuna.step.new import New
     hashes, matrices = hashes_mats(fields)
     return New(hashes, **matrices).data
 
 
+def news(fieldsets, workers=None):
+    """Create many Data objects, like [new(**fields) for fields in fieldsets], but hashing all fields at once.
+
+    Distinct field values are hashed in a thread pool of at most 'workers' threads (hashlib releases the GIL
+    for large buffers). A value shared by several objects, e.g., a common Xd list or X array, is hashed once;
+    equal lists given as different objects are replaced by a single shared instance."""
+    from aiuna.step.new import New
+    matricesets = [dict(fields2matrices(fields).items()) for fields in fieldsets]
+    distinct = {}
+    for matrices in matricesets:
+        for k, v in matrices.items():
+            distinct.setdefault(id(v), (k, v))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        digests = dict(zip(distinct, pool.map(lambda kv: mathash(*kv), distinct.values())))
+
+    shared, datas = {}, []
+    for matrices in matricesets:
+        hashes = {k: digests[id(v)] for k, v in matrices.items()}
+        for k, v in matrices.items():
+            if isinstance(v, list):
+                matrices[k] = shared.setdefault(hashes[k], v)
+        datas.append(New(hashes, **matrices).data)
+    return datas
+
+
+def project(columns, **fields):
+    """Create a Data object like new(**fields), but keeping only the given columns of X (and of Xd/Xt).
+
+    With column hashing (see aiuna.content.hashing.COLUMNS), the digest of the projected X is composed from the
+    digests of the kept columns, instead of hashing the new matrix. They are known without touching the data when X
+    is immutable and was already hashed in this process, or loaded with them (e.g. from the sidecar, see
+    aiuna.content.hashing.learn()); a user array should be frozen first (see aiuna.content.hashing.freeze()),
+    otherwise it is hashed again in each call. Dropping columns is a projection on the remaining ones."""
+    from aiuna.step.new import New
+    X = fields["X"]
+    Xp = X[:, columns]
+    others = {k: [v[j] for j in columns] if k in ["Xd", "Xt"] else v for k, v in fields.items() if k != "X"}
+    hashes, matrices = hashes_mats(others)
+    if scheme(Xp) == "cols":
+        digest = compose([columnhashes(X)[j] for j in columns])
+        own(Xp)
+        remember(Xp, digest, "cols")
+    else:
+        digest = mathash("X", Xp)
+    hashes, matrices = {"X": digest, **hashes}, {"X": Xp, **matrices}
+    return New(hashes, **matrices).data
+
+
 # noinspection PyPep8Naming
-def read_arff(filename):
+def read_arff(filename, chunk_rows=CHUNK_ROWS):
     """
     Create  from ARFF file.
 
     Assume X,y classification task and last attribute as target.
+    Numeric attributes are kept as float64, nominal ones as integer codes (-1 means missing) into the
+    category lists given by Xt/Yt. A matrix containing both kinds is float64, with codes stored as exact floats.
 
     Parameters
     ----------
     filename
-        path of the dataset
+        path of the dataset, optionally compressed (.gz, .zst or .lz4)
+    chunk_rows
+        number of data lines parsed at a time
 
     Returns
     -------
-    (dict of matrix hashes and metainfo)
+    (dict of matrix hashes, column hashes and metainfo)
     """
-    # Load file.
-    file = open(filename, "r")
-    dic = arff.load(file, encode_nominal=False)  # ['description', 'relation', 'attributes', 'data']
-    name = dic["relation"]
-    description = dic["description"]
-    file.close()
-
-    # Extract attributes and targets.
-    Arr = np.array(dic["data"])
-    Att = dic["attributes"][0:-1]
-    TgtAtt = dic["attributes"][-1]
-
-    # Extract X values (numeric when possible), descriptions and types.
-    X = Arr[:, 0:-1]
+    # Parse file in chunks of rows into typed buffers.
+    header, X, Y = read_arff_columns(opener(filename), chunk_rows)
+    own(X)
+    own(Y)
+    name, description = header["relation"], header["description"]
+    Att = header["attributes"][0:-1]
+    TgtAtt = header["attributes"][-1]
+
+    # Extract X descriptions and types.
     Xd = [tup[0] for tup in Att]
     Xt = [translate_type(tup[1]) for tup in Att]
-    if len(nominal_idxs(Xt)) == 0:
-        X = X.astype(float)
 
-    # Extract Y values (assumes categorical), descriptions and types.
-    Y = np.ascontiguousarray(Arr[:, -1].reshape((Arr.shape[0], 1)))
+    # Extract Y descriptions and types.
     Yd = [TgtAtt[0]]
     Yt = [translate_type(TgtAtt[1])]
 
     original_hashes, matrices = hashes_mats({"X": X, "Y": Y, "Xd": Xd, "Yd": Yd, "Xt": Xt, "Yt": Yt})
-    return {"dataset": name, "description": description, "matrices": matrices, "original_hashes": original_hashes}
+    return {"dataset": name, "description": description, "matrices": matrices, "original_hashes": original_hashes,
+            "column_hashes": columndigests(original_hashes)}
+
+
+def decode_nominals(M, Mt):
+    """Replace nominal codes by their values (None means missing), e.g., for exporting.
+
+    Columns that are not numeric are assumed to already contain the values themselves."""
+    M = M.astype(object)
+    for j, typ in enumerate(Mt):
+        if isinstance(typ, list) and not isinstance(M[0, j] if len(M) else "", str):
+            cats = np.array(list(typ) + [None], dtype=object)
+            codes = np.nan_to_num(M[:, j].astype(float), nan=-1).astype(int)
+            M[:, j] = cats[codes]
+    return M
 
 
 def translate_type(name):
@@ -130,10 +179,43 @@ def translate_type(name):
         raise Exception("Unknown type:", name)
 
 
-def read_csv(filename, target='class'):
-    raise NotImplementedError
-    # df = pd.read_csv(filename)  # 1169_airlines explodes here with RAM < 6GiB
-    # return read_data_frame(df, filename, target)
+def read_csv(filename, target=None, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS):
+    """
+    Create  from CSV file with a header line, without ever holding a DataFrame.
+
+    Column types are inferred from a sample of rows; nominal values are stored as codes, like in read_arff,
+    with categories in order of appearance.
+
+    Parameters
+    ----------
+    filename
+        path of the dataset, optionally compressed (.gz, .zst or .lz4)
+    target
+        name of the target column, the last one by default
+    chunk_rows
+        number of rows parsed at a time
+    sample_rows
+        number of rows used to infer column types
+
+    Returns
+    -------
+    (dict of matrix hashes, column hashes and metainfo)
+    """
+    names, types, X, Y, digests = read_csv_columns(opener(filename, newline=""), target, chunk_rows, sample_rows)
+    own(X)
+    own(Y)
+    Xd, Yd = names[:-1], names[-1:]
+    Xt, Yt = types[:-1], types[-1:]
+    fields = {"X": X, "Y": Y, "Xd": Xd, "Yd": Yd, "Xt": Xt, "Yt": Yt}
+
+    # Float matrices were already hashed during parsing (unless another hashing scheme applies to them).
+    digests = {k: digest for k, digest in digests.items() if scheme(fields[k]) == "md5"}
+    hashes, matrices = hashes_mats({k: v for k, v in fields.items() if k not in digests})
+    original_hashes = {k: digests[k] if k in digests else hashes[k] for k in fields}
+    matrices = {k: fields[k] if k in digests else matrices[k] for k in fields}
+    name = uncompressed_name(filename).split("/")[-1][:-len(".csv")]
+    return {"dataset": name, "description": "", "matrices": matrices, "original_hashes": original_hashes,
+            "column_hashes": columndigests(original_hashes)}
 
 
 def random_classification_dataset(n_attributes, n_classes, n_instances):
@@ -144,6 +226,7 @@ def random_classification_dataset(n_attributes, n_classes, n_instances):
     :param n_instances:
     :return:
     """
+    import sklearn.datasets as ds
     n = int(math.sqrt(2 * n_classes))
     X, y = ds.make_classification(
         n_samples=n_instances, n_features=n_attributes, n_classes=n_classes, n_informative=n + 1
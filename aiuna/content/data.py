@@ -22,12 +22,11 @@
 #  Relevant employers or funding agencies will be notified accordingly.
 
 import traceback
+from typing import TYPE_CHECKING
 
-import arff
 import numpy as np
-from pandas import DataFrame, Series
 
-from aiuna.content.creation import new, translate_type
+from aiuna.content.creation import new, translate_type, decode_nominals
 from aiuna.mixin.timing import withTiming, TimeoutException
 from akangatu.linalghelper import evolve_id, mat2vec, field_as_matrix, islazy
 from akangatu.transf.mixin.identification import withIdentification
@@ -38,6 +37,9 @@ from akangatu.transf.timeout import Timeout
 from garoupa.avatar23 import colors
 from garoupa.uuid import UUID
 
+if TYPE_CHECKING:
+    from pandas import DataFrame, Series
+
 
 class Data(withIdentification, withPrinting, withTiming):
     """Immutable lazy data for most machine learning scenarios.
@@ -284,13 +286,14 @@ class Data(withIdentification, withPrinting, withTiming):
 
     ###@lru_cache
     def arff(self, relation, description):
+        import arff
         Xt = [untranslate_type(typ) for typ in self.Xt]
         Yt = [untranslate_type(typ) for typ in self.Yt]
         dic = {
             "description": description,
             "relation": relation,
             "attributes": list(zip(self.Xd, Xt)) + list(zip(self.Yd, Yt)),
-            "data": np.column_stack((self.X, self.Y)),
+            "data": np.column_stack((decode_nominals(self.X, self.Xt), decode_nominals(self.Y, self.Yt))),
         }
         try:
             return arff.dumps(dic)
@@ -432,7 +435,7 @@ class Data(withIdentification, withPrinting, withTiming):
         return self.history ^ "names"
 
     @staticmethod
-    def from_pandas(X_pd: DataFrame, y_pd: Series):
+    def from_pandas(X_pd: "DataFrame", y_pd: "Series"):
         X, y = X_pd.to_numpy(), y_pd.to_numpy().astype("float")
         Xd, Yd = X_pd.columns.tolist(), [y_pd.name]
         Xt, Yt = [translate_type(str(c)) for c in X_pd.dtypes], list(sorted(set(y)))
@@ -0,0 +1,392 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+
+import ctypes
+import json
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import md5
+
+import numpy as np
+
+CHUNK_BYTES = 2 ** 24
+
+# Tree hashing (optional): matrices having at least TREE_BYTES are hashed as blocks of rows in parallel threads.
+# It gives different digests than plain md5, so it should be set equally wherever UUIDs need to match.
+TREE_BYTES = int(os.environ.get("AIUNA_TREE_BYTES", 0))  # 0 means disabled.
+TREE_BLOCK = 2 ** 22  # Part of the hash definition: changing it changes the digests.
+
+# Column hashing (optional): 2d matrices are hashed column by column, and the field digest is composed from the
+# column digests, so that a projection can be identified without rehashing (see compose()). It has precedence
+# over tree hashing and also gives different digests than plain md5.
+COLUMNS = os.environ.get("AIUNA_COLUMN_HASH", "0") == "1"
+MAX_COLUMN_DIGESTS = 2 ** 18  # Column digests kept in memory (16 bytes each, plus Python overhead).
+
+# Object arrays of strings having up to this number of distinct objects are grouped by identity (see strcodes()).
+MAX_OBJECTS = 64
+
+# Digests of live immutable arrays: (data pointer, shape, strides, dtype, scheme) -> (weak reference, hex digest).
+_digests = {}
+# Buffers created by aiuna (see own()): id -> (weak reference, appendonly).
+_owned = {}
+# Column digests of recently hashed matrices: hex digest -> list of column digests (at most MAX_COLUMN_DIGESTS in all).
+_columns = {}
+_ncolumns = 0
+
+
+def settings():
+    """Name of the hashing scheme in effect ("md5" by default). Digests made under different settings differ,
+    so caches of digests (e.g. the sidecar and shipped assets) must be kept apart by it."""
+    parts = (["cols"] if COLUMNS else []) + ([f"tree{TREE_BYTES}-{TREE_BLOCK}"] if TREE_BYTES else [])
+    return "-".join(parts) or "md5"
+
+
+def canonical(v):
+    """Deterministic bytes for an object array, for which tobytes() would give memory addresses.
+
+    Strings are dictionary encoded: shape, categories (in order of appearance) as length-prefixed UTF-8, and codes.
+    Other contents are encoded as JSON, items unknown to JSON (e.g. bytes, numpy scalars) as type name and repr;
+    or entirely as repr, if JSON cannot encode them at all (e.g. dicts with keys of mixed types)."""
+    encoded = strcodes(v.reshape(-1))
+    if encoded is None:
+        values = v.reshape(-1).tolist()
+        try:
+            return b"json" + json.dumps(values, sort_keys=True, ensure_ascii=False, default=typerepr).encode()
+        except (TypeError, ValueError):
+            return b"repr" + repr(values).encode()
+    cats, codes = encoded
+    blobs = [cat.encode() for cat in cats]
+    return b"".join([b"strs", np.array([len(v.shape), *v.shape, len(blobs)], dtype="<u8").tobytes(),
+                     np.array(list(map(len, blobs)), dtype="<u4").tobytes(), *blobs, codes.astype("<u4").tobytes()])
+
+
+def typerepr(x):
+    """JSON-friendly stand-in for an item that JSON cannot encode."""
+    return [type(x).__name__, repr(x)]
+
+
+def strcodes(flat):
+    """Categories in order of appearance and codes of a 1d object array of strings, None if not all are strings.
+
+    Labels usually repeat a few string objects (e.g. built from a list of categories), so elements are first grouped by
+    identity, sorting their addresses, and only the distinct objects are compared by value."""
+    flat = np.ascontiguousarray(flat)
+    if len(flat) == 0:
+        return [], np.zeros(0, dtype=np.int64)
+    addresses = np.ctypeslib.as_array((ctypes.c_size_t * len(flat)).from_address(flat.ctypes.data))
+    if len(np.unique(addresses[:MAX_OBJECTS * 64])) > MAX_OBJECTS:  # Cheap check on a prefix before sorting them all.
+        return strcodes_loop(flat)
+    ordered = np.sort(addresses)
+    objects = ordered[np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])]
+    if len(objects) > MAX_OBJECTS:
+        return strcodes_loop(flat)
+    masks = [addresses == o for o in objects]
+    index, codes = {}, np.empty(len(flat), dtype=np.int64)
+    for first, mask in sorted((int(mask.argmax()), mask) for mask in masks):
+        x = flat[first]
+        if not isinstance(x, str):
+            return None
+        codes[mask] = index.setdefault(x, len(index))
+    return list(index), codes
+
+
+def strcodes_loop(flat):
+    """Like strcodes(), comparing every element by value."""
+    values = flat.tolist()
+    try:
+        index = dict.fromkeys(values)
+    except TypeError:  # Unhashable values.
+        return None
+    if not all(isinstance(x, str) for x in index):
+        return None
+    for code, x in enumerate(index):
+        index[x] = code
+    return list(index), np.fromiter(map(index.__getitem__, values), dtype=np.int64, count=len(values))
+
+
+def feed(h, v, chunk_bytes=CHUNK_BYTES):
+    """Update hasher h with the same bytes as v.tobytes(), but in chunks, to keep memory usage constant.
+
+    C-contiguous arrays are fed through views of their own buffer (no copy);
+    others are copied block of rows by block of rows.
+    Object arrays are fed their canonical() bytes instead."""
+    if v.dtype.hasobject:
+        h.update(canonical(v))
+    elif v.flags.c_contiguous:
+        flat = v.reshape(-1).view(np.uint8)
+        for i in range(0, len(flat), chunk_bytes):
+            h.update(flat[i:i + chunk_bytes])
+    else:
+        step = max(1, chunk_bytes // max(1, v[:1].nbytes))
+        for i in range(0, len(v), step):
+            h.update(np.ascontiguousarray(v[i:i + step]).reshape(-1).view(np.uint8))
+    return h
+
+
+def treehash(v, threads=None, block_bytes=None):
+    """md5 of the concatenated md5 digests of blocks of rows, calculated in a thread pool.
+
+    Blocks depend only on the shape and dtype of v, so the result does not depend on the number of threads.
+    hashlib releases the GIL while hashing large buffers, so threads run in parallel."""
+    rows = max(1, (block_bytes or TREE_BLOCK) // max(1, v[:1].nbytes)) if v.ndim else 1
+    starts = range(0, max(1, len(v) if v.ndim else 1), rows)
+
+    def digest(i):
+        return feed(md5(), v[i:i + rows] if v.ndim else v).digest()
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        digests = list(pool.map(digest, starts))
+    return md5(b"tree" + b"".join(digests)).hexdigest()
+
+
+def colhash(v, chunk_bytes=CHUNK_BYTES):
+    """Digests of each column of a 2d matrix, calculated in a single pass over blocks of rows."""
+    hashers = [md5() for _ in range(v.shape[1])]
+    rows = max(1, chunk_bytes // max(1, v[:1].nbytes))
+    for i in range(0, len(v), rows):
+        block = np.asfortranarray(v[i:i + rows])
+        for j, h in enumerate(hashers):
+            h.update(block[:, j])
+    return [h.digest() for h in hashers]
+
+
+def compose(coldigests):
+    """Field digest of a matrix from the digests of its columns, in order."""
+    return md5(b"cols" + b"".join(coldigests)).hexdigest()
+
+
+def columnhashes(v):
+    """Column digests of a 2d matrix, reusing the ones calculated when it was hashed, if still known.
+
+    Without touching the data only if v is immutable (see immutable()) and was hashed or loaded with its column
+    digests (see learn()); otherwise v is hashed again, column by column, in a single pass."""
+    digest = arrayhash(v)
+    if digest in _columns:
+        return _columns[digest]
+    coldigests = colhash(v)
+    keep(digest, coldigests)
+    return coldigests
+
+
+def keep(digest, coldigests):
+    """Keep the column digests of a matrix in memory, forgetting the oldest ones beyond MAX_COLUMN_DIGESTS."""
+    global _ncolumns
+    if len(coldigests) > MAX_COLUMN_DIGESTS or digest in _columns:
+        return
+    while _ncolumns + len(coldigests) > MAX_COLUMN_DIGESTS:
+        _ncolumns -= len(_columns.pop(next(iter(_columns))))
+    _columns[digest] = coldigests
+    _ncolumns += len(coldigests)
+
+
+def columndigests(hashes):
+    """Hex column digests known for the given field digests, to be persisted along with them (see learn())."""
+    return {k: [c.hex() for c in _columns[digest]] for k, digest in hashes.items() if digest in _columns}
+
+
+def learn(matrices, hashes, coldigests):
+    """Restore digests persisted by columndigests() for immutable matrices, e.g. loaded from the sidecar, so that
+    neither they nor their projections (see aiuna.content.creation.project()) are hashed again.
+
+    Digests that do not compose the field digest (e.g. persisted under other settings) are ignored."""
+    for k, hexdigests in coldigests.items():
+        digests = [bytes.fromhex(h) for h in hexdigests]
+        if k in matrices and compose(digests) == hashes.get(k):
+            keep(hashes[k], digests)
+            remember(matrices[k], hashes[k], "cols")
+
+
+def scheme(v):
+    """How mathash() hashes this array: "cols", "tree" or "md5"."""
+    if v.dtype.hasobject:
+        return "md5"
+    if COLUMNS and v.ndim == 2:
+        return "cols"
+    if 0 < TREE_BYTES <= v.nbytes:
+        return "tree"
+    return "md5"
+
+
+def own(v, appendonly=False):
+    """Declare that the memory of v (and of its views) is only written by aiuna, so its digests can be cached.
+
+    v is made read-only, unless appendonly: then aiuna only writes into parts not yet seen by views (see Growing).
+    Only for buffers created by aiuna itself, e.g. parsed or unpacked matrices; never for arrays given by the user.
+    """
+    if not appendonly:
+        v.flags.writeable = False
+    _owned[id(v)] = weakref.ref(v, lambda r, i=id(v): _owned.pop(i, None)), appendonly
+
+
+def freeze(v):
+    """Make v read-only and let aiuna cache its digest, so that it is hashed only once while alive.
+
+    For arrays given to several new() calls, e.g. a shared X with different targets. By calling it, the user
+    promises that the memory of v will not change anymore, also through other arrays sharing it (e.g. the array
+    v is a view of), which aiuna cannot check. Views of v are frozen as well. Returns v.
+
+    Usage:
+    >>> X = freeze(np.zeros((2, 3)))
+    >>> X.flags.writeable
+    False
+    """
+    own(v)
+    return v
+
+
+def immutable(v):
+    """Whether the memory of v cannot change while v is alive.
+
+    This holds when v and every array it is a view of are read-only, down to an immutable buffer: bytes, a
+    read-only memory map or an array owned by aiuna (see own()). Other buffers may have writeable views or
+    owners elsewhere."""
+    while isinstance(v, np.ndarray):
+        ref, appendonly = _owned.get(id(v), (None, False))
+        if ref is not None and ref() is v and (appendonly or not v.flags.writeable):
+            return True
+        if v.flags.writeable:
+            return False
+        if isinstance(v, np.memmap) and v.mode == "r":
+            return True
+        v = v.base
+    if isinstance(v, memoryview):
+        v = v.obj
+    return isinstance(v, bytes)
+
+
+def remember(v, digest, scheme):
+    """Cache the digest of v while v is alive, if its memory cannot change (see immutable())."""
+    if not immutable(v):
+        return
+    key = v.__array_interface__["data"][0], v.shape, v.strides, v.dtype.str, scheme
+
+    def forget(r):
+        if _digests.get(key, (None,))[0] is r:
+            del _digests[key]
+
+    _digests[key] = weakref.ref(v, forget), digest
+
+
+def arrayhash(v):
+    """Hash an array, reusing the digest already calculated for the same memory region while it cannot change.
+
+    Only immutable arrays (see immutable()) are cached, e.g. parsed, unpacked, memory mapped or frozen (see freeze())
+    matrices; other ones are hashed each time. Object arrays are never cached."""
+    if v.dtype.hasobject:
+        return feed(md5(), v).hexdigest()
+    how = scheme(v)
+    key = v.__array_interface__["data"][0], v.shape, v.strides, v.dtype.str, how
+    ref, digest = _digests.get(key, (None, None))
+    if ref is not None and ref() is not None and immutable(v):
+        return digest
+
+    if how == "cols":
+        coldigests = colhash(v)
+        digest = compose(coldigests)
+        keep(digest, coldigests)
+    elif how == "tree":
+        digest = treehash(v)
+    else:
+        digest = feed(md5(), v).hexdigest()
+    remember(v, digest, how)
+    return digest
+
+
+class Merkle:
+    """Tree hash (see treehash()) of a matrix growing by rows, updated by hashing only the new rows.
+
+    Complete blocks of rows are kept as leaf digests; the last incomplete one as an open md5 object.
+    The final digest combines the leaves, so its cost is proportional to the number of blocks, not of rows."""
+
+    def __init__(self, rowbytes, block_bytes=None):
+        self.rows = max(1, (block_bytes or TREE_BLOCK) // max(1, rowbytes))
+        self.leaves, self.partial, self.count = [], md5(), 0
+
+    def update(self, M):
+        """Hash rows appended to the matrix."""
+        i = 0
+        while i < len(M):
+            n = min(self.rows - self.count, len(M) - i)
+            feed(self.partial, M[i:i + n])
+            self.count += n
+            i += n
+            if self.count == self.rows:
+                self.leaves.append(self.partial.digest())
+                self.partial, self.count = md5(), 0
+        return self
+
+    def hexdigest(self):
+        tail = [self.partial.digest()] if self.count or not self.leaves else []
+        return md5(b"tree" + b"".join(self.leaves + tail)).hexdigest()
+
+
+class Growing:
+    """Append-only matrix, for datasets that grow and are rebuilt as new Data objects from time to time.
+
+    Its tree hash is maintained incrementally by a Merkle object and handed to mathash() through the digest cache,
+    so new(X=g.matrix) does not rehash old rows. Only effective when tree hashing applies to the matrix
+    (see scheme()); otherwise the matrix is hashed as usual (once per call to matrix, since it is immutable).
+
+    Usage:
+    >>> g = Growing(2)
+    >>> g.append([[1, 2], [3, 4]]).matrix.shape
+    (2, 2)
+    """
+
+    def __init__(self, ncols, dtype=np.float64, capacity=1024):
+        self._buffer = np.empty((capacity, ncols), dtype=dtype)
+        own(self._buffer, appendonly=True)
+        self.n = 0
+        self.merkle = Merkle(self._buffer[:1].nbytes)
+
+    def append(self, rows):
+        rows = np.asarray(rows, dtype=self._buffer.dtype).reshape(-1, self._buffer.shape[1])
+        end = self.n + len(rows)
+        if end > len(self._buffer):  # Old views keep the old buffer alive, so they stay valid.
+            buffer = np.empty((max(end, 2 * len(self._buffer)), self._buffer.shape[1]), dtype=self._buffer.dtype)
+            buffer[:self.n] = self._buffer[:self.n]
+            self._buffer = buffer
+            own(self._buffer, appendonly=True)
+        self._buffer[self.n:end] = rows
+        self.merkle.update(self._buffer[self.n:end])
+        self.n = end
+        return self
+
+    @property
+    def matrix(self):
+        """Read-only view of the rows appended so far."""
+        v = self._buffer[:self.n]
+        v.flags.writeable = False
+        if scheme(v) == "tree":
+            remember(v, self.merkle.hexdigest(), "tree")
+        return v
+
+
+def mathash(k, v):
+    try:
+        if isinstance(v, list):
+            return md5(json.dumps(v, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+        return arrayhash(v)
+    except TypeError as e:
+        raise Exception(f"Cannot calculate hash for {k} with value {v}") from e
@@ -0,0 +1,300 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+
+import csv
+import re
+from hashlib import md5
+from itertools import islice
+
+import numpy as np
+
+CHUNK_ROWS = 2 ** 16
+SAMPLE_ROWS = 1000
+MISSING = {"", "?", "NA", "N/A", "NaN", "nan", "null", "NULL", "None"}
+COMPRESSIONS = [".gz", ".zst", ".lz4"]
+
+
+def uncompressed_name(filename):
+    """File name without a compression suffix, if any."""
+    for suffix in COMPRESSIONS:
+        if filename.endswith(suffix):
+            return filename[:-len(suffix)]
+    return filename
+
+
+def opener(filename, newline=None):
+    """Return a callable that opens a (possibly compressed) file as a text stream decompressed on the fly."""
+    if filename.endswith(".gz"):
+        import gzip
+        return lambda: gzip.open(filename, "rt", newline=newline)
+    if filename.endswith(".zst"):
+        import zstandard
+        return lambda: zstandard.open(filename, "rt", newline=newline)
+    if filename.endswith(".lz4"):
+        import lz4.frame
+        return lambda: lz4.frame.open(filename, "rt", newline=newline)
+    return lambda: open(filename, "r", newline=newline)
+
+
+def arff_header(file):
+    """Consume the header of an open ARFF text file, leaving it positioned at the first data line.
+
+    Returns
+    -------
+    liac-arff dict with 'description', 'relation' and 'attributes', but no 'data'
+    """
+    import arff
+    lines = []
+    for line in iter(file.readline, ""):
+        lines.append(line)
+        if line.strip(" \r\n").upper().startswith("@DATA"):
+            dic = arff.loads("".join(lines))
+            del dic["data"]
+            return dic
+    raise Exception("Missing @data section in ARFF file.")
+
+
+def count_lines(file, blocksize=2 ** 22):
+    """Upper bound for the number of remaining rows (blank and comment lines are also counted)."""
+    n, last = 0, "\n"
+    for block in iter(lambda: file.read(blocksize), ""):
+        n += block.count("\n")
+        last = block[-1]
+    return n + (last != "\n")
+
+
+def allocate(types, nrows):
+    """Preallocate a column buffer for a matrix whose columns are described by types (as given by liac-arff).
+
+    Nominal columns are stored as integer codes (-1 means missing); numeric ones as float64 (nan means missing).
+    A matrix with at least one numeric column is entirely float64, so that nominal codes are stored as exact floats.
+    """
+    dtype = code_dtype(types) if nominal(types) else np.float64
+    return np.empty((nrows, len(types)), dtype=dtype)
+
+
+def nominal(types):
+    """Whether all columns are nominal."""
+    return bool(types) and all(isinstance(typ, list) for typ in types)
+
+
+def code_dtype(types):
+    """Smallest signed integer type able to hold codes for all columns (plus -1 for missing)."""
+    return np.min_scalar_type(-max(1, *map(len, types)))
+
+
+def convert(values, typ, index):
+    """Convert a column of string tokens (None means missing) to floats or nominal codes."""
+    if index is None:
+        try:
+            return np.array(values, dtype=np.float64)
+        except ValueError as e:
+            raise Exception(f"Bad numeric value in ARFF data: {e}")
+    try:
+        return [-1 if v is None else index[v] for v in values]
+    except KeyError as e:
+        raise Exception(f"Value {e} not declared among nominal values {typ}.")
+
+
+def parse_rows(lines, defaults):
+    """Split ARFF data lines into lists of tokens, skipping comments and blank lines."""
+    import arff
+    rows, ncols = [], len(defaults)
+    for line in lines:
+        line = line.strip(" \r\n")
+        if not line or line.startswith("%"):
+            continue
+        values = arff._parse_values(line)  # Private to liac-arff, hence the version range pinned in setup.py.
+        if isinstance(values, dict):  # Sparse row: omitted values are zeros, i.e., the first nominal value.
+            if values and max(values) >= ncols:
+                raise Exception(f"Sparse ARFF row refers to a missing attribute: {line}")
+            values = [values.get(i, default) for i, default in enumerate(defaults)]
+        elif len(values) != ncols:
+            raise Exception(f"ARFF row has {len(values)} values instead of {ncols}: {line}")
+        rows.append(values)
+    return rows
+
+
+def read_arff_columns(opener, chunk_rows=CHUNK_ROWS):
+    """Stream the ARFF @data section in chunks of rows straight into preallocated typed buffers.
+
+    The file is traversed twice: first to bound the number of rows, then to parse them.
+    At most one chunk of tokens is kept in memory as Python objects.
+
+    Parameters
+    ----------
+    opener
+        Callable that (re)opens the file as a text stream.
+    chunk_rows
+        Number of data lines parsed at a time.
+
+    Returns
+    -------
+    (liac-arff header dict, X buffer, Y buffer), the last attribute being Y
+    """
+    with opener() as file:
+        header = arff_header(file)
+        nrows = count_lines(file)
+    types = [typ for name, typ in header["attributes"]]
+    if "STRING" in types:
+        raise Exception("Unsupported ARFF type: string")
+    indexes = [{v: i for i, v in enumerate(typ)} if isinstance(typ, list) else None for typ in types]
+    defaults = [typ[0] if isinstance(typ, list) else "0" for typ in types]
+    X, Y = allocate(types[:-1], nrows), allocate(types[-1:], nrows)
+    nx, start = len(types) - 1, 0
+    with opener() as file:
+        arff_header(file)
+        lines = iter(file.readline, "")
+        for chunk in iter(lambda: list(islice(lines, chunk_rows)), []):
+            rows = parse_rows(chunk, defaults)
+            if not rows:
+                continue
+            end = start + len(rows)
+            for j, (values, typ, index) in enumerate(zip(zip(*rows), types, indexes)):
+                M, col = (X, j) if j < nx else (Y, 0)
+                M[start:end, col] = convert(values, typ, index)
+            start = end
+    X.resize((start, nx), refcheck=False)
+    Y.resize((start, 1), refcheck=False)
+    return header, X, Y
+
+
+def infer_types(rows, ncols):
+    """Guess column types from a sample of CSV rows: 'int', 'real' or a (still empty) list of nominal values."""
+    types = []
+    for j in range(ncols):
+        present = [row[j].strip() for row in rows if row[j].strip() not in MISSING]
+        try:
+            np.array(present, dtype=np.float64)
+        except ValueError:
+            types.append([])
+            continue
+        types.append("int" if all(re.fullmatch(r"[+-]?[0-9]+", v) for v in present) else "real")
+    return types
+
+
+def encode(values, index):
+    """Convert a column of CSV tokens to nominal codes, registering unseen values in order of appearance."""
+    codes = []
+    for v in values:
+        v = v.strip()
+        codes.append(-1 if v in MISSING else index.setdefault(v, len(index)))
+    return codes
+
+
+def read_csv_head(opener, sample_rows, delimiter):
+    """Column names, first sample_rows non-empty rows and a (slight over)estimate of the number of rows."""
+    with opener() as file:
+        rows = csv.reader(iter(file.readline, ""), delimiter=delimiter)
+        names = [name.strip() for name in next(rows)]
+        sample = [row for row in islice(rows, sample_rows) if row]
+        nrows = len(sample) + count_lines(file)
+    if any(len(row) != len(names) for row in sample):
+        raise Exception(f"CSV rows should have {len(names)} values.")
+    return names, sample, nrows
+
+
+def csv_chunks(rows, chunk_rows, ncols):
+    """Lists of at most chunk_rows non-empty CSV rows."""
+    for chunk in iter(lambda: list(islice(rows, chunk_rows)), []):
+        chunk = [row for row in chunk if row]
+        if any(len(row) != ncols for row in chunk):
+            raise Exception(f"CSV rows should have {ncols} values.")
+        if chunk:
+            yield chunk
+
+
+def fill(M, rows, col, tokens, index, name):
+    """Store a column of CSV tokens into M[rows, col], as floats (index is None) or as nominal codes."""
+    if index is not None:
+        M[rows, col] = encode(tokens, index)
+        return
+    values = [None if v.strip() in MISSING else v for v in tokens]
+    try:
+        M[rows, col] = np.array(values, dtype=np.float64)
+    except ValueError as e:
+        raise Exception(f"Column '{name}' seemed numeric, but {e}. Try a larger sample_rows.")
+
+
+def read_csv_columns(opener, target=None, chunk_rows=CHUNK_ROWS, sample_rows=SAMPLE_ROWS, delimiter=","):
+    """Stream a CSV file (with a header line) in chunks of rows straight into preallocated typed buffers.
+
+    Column types are inferred from the first sample_rows rows; a column that looks numeric there but
+    has a non-numeric value later raises an exception.
+    Matrices stored as float64 are md5-hashed chunk by chunk while being filled, like mathash would do.
+
+    Parameters
+    ----------
+    opener
+        Callable that (re)opens the file as a text stream.
+    target
+        Name of the target column; the last one by default.
+
+    Returns
+    -------
+    (column names, column types, X buffer, Y buffer, dict of hex digests of the float64 ones among X/Y)
+    """
+    names, sample, nrows = read_csv_head(opener, sample_rows, delimiter)
+    ncols = len(names)
+    if target is None:
+        target = names[-1]
+    if target not in names:
+        raise Exception(f"Target column {target} not found in CSV header:", names)
+
+    # Reorder columns so that the target is the last one.
+    t = names.index(target)
+    order = [j for j in range(ncols) if j != t] + [t]
+    names = [names[j] for j in order]
+    types = infer_types(sample, ncols)
+    types = [types[j] for j in order]
+    indexes = [{} if isinstance(typ, list) else None for typ in types]
+    nx, start = ncols - 1, 0
+    # The number of categories is only known at the end, so codes are narrowed afterwards.
+    Xt, Yt = types[:-1], types[-1:]
+    X = np.empty((nrows, nx), dtype=np.int32 if nominal(Xt) else np.float64)
+    Y = np.empty((nrows, 1), dtype=np.int32 if nominal(Yt) else np.float64)
+    hashers = {k: md5() for k, M in [("X", X), ("Y", Y)] if M.dtype == np.float64}
+
+    with opener() as file:
+        rows = csv.reader(iter(file.readline, ""), delimiter=delimiter)
+        next(rows)
+        for chunk in csv_chunks(rows, chunk_rows, ncols):
+            end = start + len(chunk)
+            columns = list(zip(*chunk))
+            for j, (src, index) in enumerate(zip(order, indexes)):
+                M, col = (X, j) if j < nx else (Y, 0)
+                fill(M, slice(start, end), col, columns[src], index, names[j])
+            for k, h in hashers.items():
+                h.update((X if k == "X" else Y)[start:end].data)
+            start = end
+
+    for typ, index in zip(types, indexes):
+        if index is not None:
+            typ.extend(index)
+    X.resize((start, nx), refcheck=False)
+    Y.resize((start, 1), refcheck=False)
+    if nominal(Xt):
+        X = X.astype(code_dtype(Xt))
+    if nominal(Yt):
+        Y = Y.astype(code_dtype(Yt))
+    return names, types, X, Y, {k: h.hexdigest() for k, h in hashers.items()}
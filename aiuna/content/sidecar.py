@@ -0,0 +1,206 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+
+import json
+import os
+import shutil
+import threading
+from hashlib import md5
+
+import numpy as np
+
+from aiuna.content.hashing import learn, settings
+
+FORMAT = 1  # Bump whenever the parsed representation changes, so that old entries are ignored.
+CACHE_DIR = os.environ.get("AIUNA_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "aiuna"))
+CACHE_BUDGET = int(os.environ.get("AIUNA_CACHE_BUDGET", 2 ** 33))
+
+
+def content_hash(filename, blocksize=2 ** 22):
+    """md5 of the bytes of a file, read in blocks."""
+    h = md5()
+    with open(filename, "rb") as f:
+        for block in iter(lambda: f.read(blocksize), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+def read_entry(entry):
+    """Load a directory written by write_entry(), memory mapping its matrices (read-only).
+
+    Stored column hashes, if any, are restored, so that projections of the matrices need not read them."""
+    dic = read_json(os.path.join(entry, "meta.json"))
+    if dic is None:
+        raise FileNotFoundError("Missing or incomplete entry:", entry)
+    for k in dic.pop("arrays"):
+        dic["matrices"][k] = np.load(os.path.join(entry, k + ".npy"), mmap_mode="r")
+    learn(dic["matrices"], dic.get("original_hashes", {}), dic.get("column_hashes", {}))
+    return dic
+
+
+def write_entry(entry, dic):
+    """Save a dict of matrices, hashes and metainfo (as returned by read_arff) into a directory.
+
+    Returns
+    -------
+    False if there are object arrays, which cannot be memory mapped; True otherwise
+    """
+    matrices = dic["matrices"]
+    arrays = [k for k, v in matrices.items() if isinstance(v, np.ndarray)]
+    if any(matrices[k].dtype.hasobject for k in arrays):
+        return False
+    os.makedirs(entry, exist_ok=True)
+    for k in arrays:
+        np.save(os.path.join(entry, k + ".npy"), matrices[k])
+    meta = dic.copy()
+    meta["matrices"] = {k: v for k, v in matrices.items() if k not in arrays}
+    meta["arrays"] = arrays
+    write_json(os.path.join(entry, "meta.json"), meta)
+    return True
+
+
+def read_json(filename):
+    try:
+        with open(filename) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(filename, obj):
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    tmp = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            json.dump(obj, f, ensure_ascii=False)
+        os.replace(tmp, filename)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+class Sidecar:
+    """Persistent content-addressed cache of parsed dataset files.
+
+    Each entry holds the matrices as .npy files (loaded back as read-only memory maps) and the remaining fields,
+    hashes and metainfo as JSON. A per-path index records size and mtime of the source, so that warm loads do not
+    need to read it. Least recently used entries are evicted whenever the total size exceeds the budget (in bytes).
+    """
+
+    def __init__(self, dir=CACHE_DIR, budget=CACHE_BUDGET):
+        self.dir = os.path.join(dir, f"v{FORMAT}")
+        self.budget = budget
+
+    @property
+    def root(self):
+        """Directory of the index and entries, apart for each hashing scheme, since entries hold digests."""
+        return os.path.join(self.dir, settings())
+
+    def load(self, filename, parse):
+        """Return the dict parse(filename) would return, but from the cache whenever the file content is known.
+
+        Matrices come back as read-only np.memmap objects.
+        """
+        st = os.stat(filename)
+        key = [st.st_size, st.st_mtime_ns]
+        indexfile = os.path.join(self.root, "index", md5(os.path.abspath(filename).encode()).hexdigest() + ".json")
+        index = read_json(indexfile)
+        if index and index["key"] == key:
+            dic = self._fetch(index["digest"])
+            if dic is not None:
+                return dic
+
+        digest = content_hash(filename)
+        if index and index["digest"] != digest:  # Stale entry.
+            self._remove(index["digest"])
+        dic = self._fetch(digest)
+        if dic is None:
+            dic = self._store(digest, parse(filename))
+        try:
+            write_json(indexfile, {"path": os.path.abspath(filename), "key": key, "digest": digest})
+        except OSError:  # Unwritable cache: the file will be hashed again next time.
+            pass
+        return dic
+
+    def _entry(self, digest):
+        return os.path.join(self.root, "entries", digest)
+
+    def _fetch(self, digest):
+        """Entry content, or None if it is missing (e.g. never stored, or evicted by another process)."""
+        entry = self._entry(digest)
+        try:
+            os.utime(os.path.join(entry, "meta.json"))  # Mark as recently used.
+            return read_entry(entry)
+        except OSError:
+            return None
+
+    def _store(self, digest, dic):
+        """Store the parsed content and return it from the cache; or as is, if it cannot be stored (object arrays,
+        read-only or full disk, ...)."""
+        entry = self._entry(digest)
+        tmp = f"{entry}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            stored = write_entry(tmp, dic)
+        except OSError:
+            stored = False
+        if not stored:
+            shutil.rmtree(tmp, ignore_errors=True)
+            return dic
+        try:
+            os.rename(tmp, entry)
+        except OSError:  # Another process stored the same content meanwhile.
+            shutil.rmtree(tmp, ignore_errors=True)
+        self.evict(keep=digest)
+        fetched = self._fetch(digest)
+        return dic if fetched is None else fetched
+
+    def _remove(self, digest):
+        shutil.rmtree(self._entry(digest), ignore_errors=True)
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the cache fits the budget."""
+        entriesdir = os.path.join(self.root, "entries")
+        entries = []
+        for digest in os.listdir(entriesdir):
+            if digest.endswith(".tmp"):  # Being written by another process.
+                continue
+            entry = os.path.join(entriesdir, digest)
+            try:
+                size = sum(f.stat().st_size for f in os.scandir(entry))
+                entries.append((os.stat(os.path.join(entry, "meta.json")).st_mtime_ns, size, digest))
+            except OSError:  # Being written or removed by another process.
+                pass
+        total = sum(size for _, size, _ in entries)
+        for _, size, digest in sorted(entries):
+            if total <= self.budget:
+                break
+            if digest != keep:
+                self._remove(digest)
+                total -= size
+
+    def clear(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+
+sidecar = Sidecar()
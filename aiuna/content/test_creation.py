@@ -0,0 +1,64 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from aiuna.content import creation
+from aiuna.content import hashing
+from aiuna.content.creation import new, news, project
+from aiuna.content.hashing import feed, freeze
+
+
+class TestCreation(TestCase):
+    def test_news(self):
+        rng = np.random.default_rng(0)
+        X = rng.random((100, 3))
+        fieldsets = [{"X": X, "Y": rng.integers(0, 2, (100, 1)), "Xd": ["a", "b", "c"]} for _ in range(4)]
+        with patch.object(creation, "mathash", wraps=creation.mathash) as mathash:
+            datas = news(fieldsets, workers=2)
+            hashed = [id(v) for _, v in (call.args for call in mathash.call_args_list)]
+        self.assertEqual(1, hashed.count(id(X)))  # Shared array hashed once.
+        self.assertEqual(1 + 4 + 4, len(hashed))  # Equal lists given as different objects are hashed each.
+        self.assertTrue(all(d.Xd is datas[0].Xd for d in datas))  # ...but end up as one shared instance.
+        self.assertEqual([new(**fields).uuid for fields in fieldsets], [d.uuid for d in datas])
+
+    def test_freeze(self):
+        rng = np.random.default_rng(0)
+        X = freeze(rng.random((100, 3)))
+        new(X=X, Y=rng.integers(0, 2, (100, 1)))
+        with patch("aiuna.content.hashing.feed", wraps=feed) as f:
+            new(X=X, Y=rng.integers(0, 2, (100, 1)))
+            self.assertEqual(1, f.call_count)  # Only the new Y.
+
+    def test_project(self):
+        rng = np.random.default_rng(0)
+        X, Y = freeze(rng.random((100, 5))), freeze(rng.integers(0, 2, (100, 1)))
+        with patch.object(hashing, "COLUMNS", True):
+            expected = new(X=X[:, [3, 1]], Y=Y, Xd=["d", "b"]).uuid
+            new(X=X, Y=Y)
+            with patch("aiuna.content.hashing.colhash") as c, patch("aiuna.content.hashing.feed") as f:
+                data = project([3, 1], X=X, Y=Y, Xd=["a", "b", "c", "d", "e"])
+                self.assertEqual(0, c.call_count + f.call_count)
+        self.assertEqual(expected, data.uuid)
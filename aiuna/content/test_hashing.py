@@ -0,0 +1,158 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+from hashlib import md5
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from aiuna.compression import pack, pack_array, unpack, unpack_array
+from aiuna.content import hashing
+from aiuna.content.hashing import Growing, Merkle, arrayhash, colhash, columndigests, columnhashes, compose, feed, \
+    freeze, keep, learn, mathash, own, treehash
+
+
+class TestHashing(TestCase):
+    def test_feed(self):
+        A = np.random.default_rng(0).random((1000, 37))
+        for v in [A, A.T, A[::3], A[:, 5], np.array(["a", "bcd"]), np.zeros((0, 3))]:
+            self.assertEqual(md5(v.tobytes()).hexdigest(), feed(md5(), v, chunk_bytes=100).hexdigest())
+
+    def test_treehash(self):
+        A = np.random.default_rng(0).random((1000, 37))
+        expected = treehash(A, threads=1, block_bytes=1000)
+        self.assertEqual(expected, treehash(A, threads=4, block_bytes=1000))
+        self.assertEqual(expected, treehash(np.asfortranarray(A), threads=3, block_bytes=1000))
+
+    def test_arrayhash(self):
+        X = np.random.default_rng(0).random((100, 7))
+        B = X[:]
+        self.assertEqual(md5(X.tobytes()).hexdigest(), arrayhash(X))
+        self.assertTrue(X.flags.writeable)  # User arrays are left alone...
+        B[0, 0] = 42
+        self.assertEqual(md5(X.tobytes()).hexdigest(), arrayhash(X))  # ...and rehashed, even if written through views.
+        X.flags.writeable = False
+        B[0, 0] = 43
+        self.assertEqual(md5(X.tobytes()).hexdigest(), arrayhash(X))
+        b = bytearray(X.tobytes())
+        F = np.frombuffer(b)
+        F.flags.writeable = False
+        arrayhash(F)
+        b[0] ^= 1
+        self.assertEqual(md5(b).hexdigest(), arrayhash(F))
+
+        # Buffers owned by aiuna and read-only memory are hashed only once while alive.
+        O = np.random.default_rng(0).random((100, 7))
+        own(O)
+        for v in [O, np.frombuffer(O.tobytes()), unpack(pack(O)), unpack_array(pack_array(O, "raw", filter="none"))]:
+            expected = arrayhash(v)
+            with patch("aiuna.content.hashing.feed", wraps=feed) as f:
+                self.assertEqual(expected, arrayhash(v))
+                self.assertEqual(expected, arrayhash(v.reshape(v.shape)))
+                self.assertEqual(0, f.call_count)
+        O.flags.writeable = True
+        O[0, 0] = 42
+        self.assertEqual(md5(O.tobytes()).hexdigest(), arrayhash(O))
+
+        # User arrays, once frozen.
+        U = freeze(np.random.default_rng(0).random((100, 7)))
+        self.assertFalse(U.flags.writeable)
+        expected = arrayhash(U)
+        with patch("aiuna.content.hashing.feed", wraps=feed) as f:
+            self.assertEqual(expected, arrayhash(U[:]))
+            self.assertEqual(0, f.call_count)
+
+    def test_merkle(self):
+        A = np.random.default_rng(0).random((1000, 37))
+        merkle = Merkle(A[:1].nbytes, block_bytes=1000)
+        for start, end in [(0, 1), (1, 100), (100, 100), (100, 1000)]:
+            merkle.update(A[start:end])
+            self.assertEqual(treehash(A[:end], block_bytes=1000), merkle.hexdigest())
+
+    def test_growing(self):
+        A = np.random.default_rng(0).random((3000, 7))
+        for tree_bytes in [0, 1]:  # Disabled (default), and for any size.
+            with patch.object(hashing, "TREE_BYTES", tree_bytes):
+                g = Growing(7, capacity=10)
+                for start, end in [(0, 2), (2, 2), (2, 50), (50, 3000)]:
+                    g.append(A[start:end])
+                    M = g.matrix
+                    expected = treehash(A[:end]) if tree_bytes else md5(A[:end].tobytes()).hexdigest()
+                    self.assertEqual(expected, mathash("X", M))
+                    self.assertEqual(expected, mathash("X", g.matrix))
+                self.assertTrue(np.array_equal(A, M))
+
+    def test_compose(self):
+        A = np.random.default_rng(0).random((1000, 37))
+        coldigests = colhash(A, chunk_bytes=1000)
+        self.assertEqual(compose(colhash(A[:, [5, 2]])), compose([coldigests[5], coldigests[2]]))
+
+    def test_learn(self):
+        A = np.random.default_rng(0).random((1000, 37))
+        own(A)
+        with patch.object(hashing, "COLUMNS", True), patch.object(hashing, "_columns", {}):
+            digest = arrayhash(A)
+            persisted = columndigests({"A": digest, "B": "?"})
+            self.assertEqual(["A"], list(persisted))
+            hashing._columns.clear()  # As in another process.
+            B = np.frombuffer(A.tobytes()).reshape(A.shape)
+            learn({"B": B}, {"B": "?"}, {"B": persisted["A"]})  # Digests not composing the field digest are ignored.
+            self.assertEqual({}, hashing._columns)
+            learn({"B": B}, {"B": digest}, {"B": persisted["A"]})
+            with patch("aiuna.content.hashing.colhash") as c, patch("aiuna.content.hashing.feed") as f:
+                self.assertEqual(digest, arrayhash(B))
+                self.assertEqual(colhash(A), columnhashes(B))
+                self.assertEqual(0, c.call_count + f.call_count)
+
+    def test_keep(self):
+        with patch.object(hashing, "MAX_COLUMN_DIGESTS", 10), patch.object(hashing, "_columns", {}), \
+                patch.object(hashing, "_ncolumns", 0):
+            for digest in "abc":
+                keep(digest, [b"x"] * 4)
+            keep("d", [b"x"] * 11)  # Too wide to be kept.
+            self.assertEqual(["b", "c"], list(hashing._columns))
+            self.assertEqual(8, hashing._ncolumns)
+
+    def test_object_arrays(self):
+        labels = ["Iris-setosa", "Iris-versicolor", "Iris-setosa"]
+        y = np.array(labels, dtype=object).reshape(3, 1)
+        # Copies have other element addresses, but the same content.
+        self.assertEqual(mathash("y", y), mathash("y", np.array([s + "" for s in labels], dtype=object).reshape(3, 1)))
+        self.assertNotEqual(mathash("y", y), mathash("y", y.reshape(1, 3)))
+        self.assertEqual(mathash("y", np.array([1, None], dtype=object)), mathash("y", np.array([1, None], dtype=object)))
+        for items in [[b"x", b"y"], [np.int64(1), "a"], [np.float32(0.5), b"x", None], [{1: 2, "a": 3}]]:
+            self.assertEqual(mathash("y", np.array(items, dtype=object)), mathash("y", np.array(items, dtype=object)))
+        self.assertNotEqual(mathash("y", np.array([b"x"], dtype=object)), mathash("y", np.array(["x"], dtype=object)))
+
+    def test_canonical(self):
+        labels = ["b", "a", "ção"]
+        y = np.array([labels[i] for i in np.random.default_rng(0).integers(0, 3, 1000)], dtype=object)
+        distinct = np.array(["".join(s) for s in y], dtype=object)  # Equal strings, but not the same objects.
+        self.assertEqual(hashing.canonical(y), hashing.canonical(distinct))
+        with patch.object(hashing, "MAX_OBJECTS", 1):
+            self.assertEqual(hashing.canonical(y), hashing.canonical(distinct))
+        cats, codes = hashing.strcodes(y)
+        self.assertEqual(y.tolist(), [cats[c] for c in codes])
+        self.assertEqual(list(dict.fromkeys(y.tolist())), cats)
+        self.assertIsNone(hashing.strcodes(np.array(["a", None, "a"], dtype=object)))
+        self.assertIsNone(hashing.strcodes(np.array([["a"], ["b"]] + [None] * 100, dtype=object)))
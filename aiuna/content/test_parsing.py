@@ -0,0 +1,100 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+import gzip
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import lz4.frame
+import numpy as np
+import zstandard
+
+from aiuna.content.hashing import mathash
+from aiuna.content.parsing import opener, read_arff_columns, read_csv_columns, uncompressed_name
+
+ARFF = """% Toy dataset.
+@relation toy
+@attribute a numeric
+@attribute 'b c' {x,'y z'}
+@attribute k {p,q}
+@data
+% comment inside data
+1.5,x,p
+
+{1 'y z'}
+?,?,q
+"""
+
+CSV = """id, label ,x,city
+1,yes,0.5,"Rio, RJ"
+2,no,NA,Lisboa
+-3,,1e3,"Rio, RJ"
+
+4,yes,?,
+"""
+
+
+class TestParsing(TestCase):
+    def test_read_arff_columns(self):
+        with TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "toy.arff")
+            with open(filename, "w") as f:
+                f.write(ARFF)
+            header, X, Y = read_arff_columns(lambda: open(filename), chunk_rows=1)
+        self.assertEqual("toy", header["relation"])
+        self.assertEqual((3, 2), X.shape)
+        np.testing.assert_array_equal(np.array([[1.5, 0], [0, 1], [np.nan, -1]]), X)
+        np.testing.assert_array_equal(np.array([[0], [0], [1]]), Y)
+
+    def test_read_csv_columns(self):
+        with TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, "toy.csv")
+            with open(filename, "w", newline="") as f:
+                f.write(CSV)
+            names, types, X, Y, digests = read_csv_columns(lambda: open(filename, newline=""), "label", chunk_rows=2)
+            # A numeric target is kept as float64, hashed while parsed too.
+            _, _, Xn, Yn, digestsn = read_csv_columns(lambda: open(filename, newline=""), "x", chunk_rows=3)
+        self.assertEqual(["id", "x", "city", "label"], names)
+        self.assertEqual(["int", "real", ["Rio, RJ", "Lisboa"], ["yes", "no"]], types)
+        np.testing.assert_array_equal(np.array([[1, 0.5, 0], [2, np.nan, 1], [-3, 1000, 0], [4, np.nan, -1]]), X)
+        np.testing.assert_array_equal(np.array([[0], [1], [-1], [0]]), Y)
+        self.assertEqual(np.int8, Y.dtype)
+        self.assertEqual({"X": mathash("X", X)}, digests)
+        self.assertEqual(np.float64, Yn.dtype)
+        self.assertEqual({"X": mathash("X", Xn), "Y": mathash("Y", Yn)}, digestsn)
+        np.testing.assert_array_equal(np.array([[0.5], [np.nan], [1000], [np.nan]]), Yn)
+
+    def test_compressed(self):
+        with TemporaryDirectory() as tmp:
+            for name, content, read in [("toy.arff", ARFF, lambda o: read_arff_columns(o, chunk_rows=2)[1:]),
+                                        ("toy.csv", CSV, lambda o: read_csv_columns(o, chunk_rows=2)[2:4])]:
+                filename = os.path.join(tmp, name)
+                with open(filename, "w", newline="") as f:
+                    f.write(content)
+                expected = read(opener(filename, newline=""))
+                for suffix, module in [(".gz", gzip), (".zst", zstandard), (".lz4", lz4.frame)]:
+                    with module.open(filename + suffix, "wb") as f:
+                        f.write(content.encode())
+                    self.assertEqual(filename, uncompressed_name(filename + suffix))
+                    for a, b in zip(expected, read(opener(filename + suffix, newline=""))):
+                        np.testing.assert_array_equal(a, b)
@@ -0,0 +1,126 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+import os
+import shutil
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from aiuna.content import hashing
+from aiuna.content.hashing import arrayhash, columndigests, columnhashes, own
+from aiuna.content.sidecar import Sidecar, content_hash, read_entry, write_entry
+
+
+class TestSidecar(TestCase):
+    def setUp(self):
+        self.tmp = TemporaryDirectory()
+        self.parsed = []
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def file(self, name, content):
+        filename = os.path.join(self.tmp.name, name)
+        with open(filename, "w") as f:
+            f.write(content)
+        return filename
+
+    def parse(self, filename):
+        self.parsed.append(filename)
+        with open(filename) as f:
+            X = np.array([[float(v) for v in line.split(",")] for line in f])
+        return {"dataset": filename, "matrices": {"X": X, "Xd": ["a", "b"]}, "original_hashes": {"X": "?"}}
+
+    def test_load(self):
+        sidecar = Sidecar(os.path.join(self.tmp.name, "cache"), budget=2 ** 20)
+        filename = self.file("a.csv", "1,2\n3,4\n")
+        cold = sidecar.load(filename, self.parse)
+        warm = sidecar.load(filename, self.parse)
+        self.assertEqual([filename], self.parsed)
+        self.assertIsInstance(warm["matrices"]["X"], np.memmap)
+        self.assertFalse(warm["matrices"]["X"].flags.writeable)
+        self.assertTrue(np.array_equal(cold["matrices"]["X"], warm["matrices"]["X"]))
+        self.assertEqual(["a", "b"], warm["matrices"]["Xd"])
+
+        os.utime(filename, ns=(0, 0))  # Same content, another mtime: hashed, but not parsed again.
+        sidecar.load(filename, self.parse)
+        self.assertEqual(1, len(self.parsed))
+
+        self.file("a.csv", "5,6\n7,8\n9,0\n")  # Stale entry.
+        self.assertEqual((3, 2), sidecar.load(filename, self.parse)["matrices"]["X"].shape)
+        self.assertEqual(2, len(self.parsed))
+        self.assertEqual(1, len(os.listdir(os.path.join(sidecar.root, "entries"))))
+
+        shutil.rmtree(os.path.join(sidecar.root, "entries"))  # Evicted by another process.
+        self.assertEqual((3, 2), sidecar.load(filename, self.parse)["matrices"]["X"].shape)
+        self.assertEqual(3, len(self.parsed))
+
+        with patch.object(hashing, "COLUMNS", True):  # Digests of other hashing schemes are kept apart.
+            sidecar.load(filename, self.parse)
+        self.assertEqual(4, len(self.parsed))
+
+    def test_evict(self):
+        sidecar = Sidecar(os.path.join(self.tmp.name, "cache"), budget=2 ** 20)
+        filenames = [self.file(f"{i}.csv", "\n".join(["1,2"] * 1000 * (i + 1))) for i in range(3)]
+        for i, filename in enumerate(filenames):
+            sidecar.load(filename, self.parse)
+            os.utime(os.path.join(sidecar._entry(content_hash(filename)), "meta.json"), ns=(i, i))
+        sidecar.load(filenames[0], self.parse)  # Most recently used, now.
+        self.assertEqual(3, len(self.parsed))
+        entries = os.path.join(sidecar.root, "entries")
+        os.makedirs(os.path.join(entries, "other.123.tmp"))  # Being written by another process.
+        sidecar.budget = 70000
+        sidecar.evict()
+        self.assertEqual(sorted([content_hash(filenames[0]), content_hash(filenames[2]),
+                                 "other.123.tmp"]), sorted(os.listdir(entries)))
+        sidecar.load(filenames[1], self.parse)
+        self.assertEqual(4, len(self.parsed))
+
+    def test_unwritable(self):
+        cachedir = self.file("cache", "")  # A file where the cache directory should be: nothing can be written.
+        filename = self.file("a.csv", "1,2\n3,4\n")
+        sidecar = Sidecar(cachedir, budget=2 ** 20)
+        for _ in range(2):
+            self.assertTrue(np.array_equal([[1, 2], [3, 4]], sidecar.load(filename, self.parse)["matrices"]["X"]))
+        self.assertEqual(2, len(self.parsed))
+        with patch("numpy.save", side_effect=OSError(28, "No space left on device")):
+            sidecar = Sidecar(os.path.join(self.tmp.name, "full"), budget=2 ** 20)
+            self.assertEqual(["a", "b"], sidecar.load(filename, self.parse)["matrices"]["Xd"])
+        self.assertEqual([], [f for f in os.listdir(os.path.join(sidecar.root, "entries")) if f.endswith(".tmp")])
+
+    def test_columns(self):
+        X = np.random.default_rng(0).random((100, 7))
+        own(X)
+        entry = os.path.join(self.tmp.name, "entry")
+        with patch.object(hashing, "COLUMNS", True), patch.object(hashing, "_columns", {}):
+            digest = arrayhash(X)
+            write_entry(entry, {"matrices": {"X": X}, "original_hashes": {"X": digest},
+                                "column_hashes": columndigests({"X": digest})})
+            hashing._columns.clear()  # As in another process.
+            M = read_entry(entry)["matrices"]["X"]
+            with patch("aiuna.content.hashing.colhash") as c, patch("aiuna.content.hashing.feed") as f:
+                self.assertEqual(digest, arrayhash(M))
+                self.assertEqual(7, len(columnhashes(M)))
+                self.assertEqual(0, c.call_count + f.call_count)
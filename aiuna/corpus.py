@@ -0,0 +1,79 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+"""Synthetic step/history metadata, the training corpus of the shipped zstd dictionary (see compression.build_dictionary).
+
+Records follow the Leaf.asdict layout ({"id": ..., "desc": {"name", "path", "config"}}), with steps of aiuna and of the
+libraries built on it. Everything is derived from the seed, so the corpus, and hence the dictionary, is reproducible.
+"""
+import random
+import string
+
+ALPHABET = string.digits + string.ascii_letters
+
+
+def metadata(seed=0, steps=4000, histories=2000):
+    """Single steps followed by histories (lists of 2 to 8 steps), always in the same order for the same arguments."""
+    rng = random.Random(seed)
+
+    def uid():
+        return "".join(rng.choice(ALPHABET) for _ in range(23))
+
+    def md5():
+        return "".join(rng.choice("0123456789abcdef") for _ in range(32))
+
+    def hashes():
+        return {"X": md5(), "Y": md5(), "Xd": md5(), "Yd": md5(), "Xt": md5(), "Yt": md5()}
+
+    configs = [
+        ("New", "aiuna.step.new", lambda: {"hashes": {k: md5() for k in rng.sample("XYZP", rng.randint(1, 3))}}),
+        ("File", "aiuna.step.file",
+         lambda: {"name": rng.choice(["iris", "abalone", "abalone3", "mushroom", "wine"]) +
+                  rng.choice([".arff", ".csv", ".arff.gz"]),
+                  "path": rng.choice(["./", "iris/", "/tmp/", "datasets/"]), "hashes": hashes()}),
+        ("Dataset", "aiuna.step.dataset", lambda: {"name": rng.choice(["iris", "abalone", "wine", "digits"])}),
+        ("Let", "aiuna.step.let", lambda: {"field": rng.choice("XYZPW"), "value": rng.choice([[1, 2], "abc", 0.5])}),
+        ("Del", "aiuna.step.delete", lambda: {"field": rng.choice("XYZPW")}),
+        ("Split", "kururu.tool.evaluation.split",
+         lambda: {"mode": "holdout", "test_size": rng.choice([0.3, 0.25, 0.2]), "seed": rng.randint(0, 9)}),
+        ("Partition", "kururu.tool.evaluation.partition",
+         lambda: {"mode": "cv", "splits": rng.choice([5, 10]), "seed": rng.randint(0, 9), "fields": "X,Y"}),
+        ("SVMC", "kururu.tool.learning.supervised.classification.svmc",
+         lambda: {"C": rng.choice([0.1, 1.0, 10.0]), "kernel": rng.choice(["rbf", "linear", "poly"]), "degree": 3,
+                  "gamma": "scale", "seed": rng.randint(0, 9)}),
+        ("RF", "kururu.tool.learning.supervised.classification.rf",
+         lambda: {"n_estimators": rng.choice([10, 100]), "max_depth": rng.choice([None, 5]), "seed": rng.randint(0, 9)}),
+        ("PCA", "kururu.tool.enhancement.pca", lambda: {"n": rng.randint(2, 9)}),
+        ("Binarize", "kururu.tool.enhancement.binarize", lambda: {}),
+        ("Metric", "kururu.tool.evaluation.metric",
+         lambda: {"functions": rng.sample(["accuracy", "balanced_accuracy", "length"], 2), "target": "r",
+                  "prediction": "z"}),
+        ("Summ", "kururu.tool.evaluation.summ", lambda: {"field": "R", "function": rng.choice(["mean", "std"])}),
+        ("Map", "akangatu.operator.unary.map", lambda: {"step": uid()}),
+        ("Chain", "akangatu.operator.binary.chain", lambda: {"steps": [uid() for _ in range(rng.randint(2, 4))]}),
+    ]
+
+    def step():
+        name, path, config = rng.choice(configs)
+        return {"id": uid(), "desc": {"name": name, "path": path, "config": config()}}
+
+    return [step() for _ in range(steps)] + [[step() for _ in range(rng.randint(2, 8))] for _ in range(histories)]
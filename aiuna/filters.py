@@ -0,0 +1,118 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+"""Reversible transformations of array blocks that make them more compressible.
+
+Each filter takes the raw bytes of a block of items (a uint8 array) and returns bytes of the same length.
+Blocks are filtered independently, so a filtered dump can still be produced and read block by block.
+Items lag positions apart are neighbours in the same column (lag is the number of columns of a C-ordered matrix).
+"""
+import numpy as np
+
+
+def apply(block, filter, dtype, lag=1):
+    if filter == "none":
+        return block
+    if filter == "shuffle":
+        return shuffle(block, dtype.itemsize)
+    if filter == "delta":
+        return delta(block, dtype.itemsize)
+    if filter == "xor":
+        return shuffle(xor(block, dtype.itemsize, lag), dtype.itemsize)
+    raise Exception("Unknown filter:", filter)
+
+
+def reverse(block, filter, dtype, out=None, lag=1):
+    """Undo the filter, writing into the uint8 array out when given."""
+    if out is None:
+        out = np.empty(len(block), dtype=np.uint8)
+    if filter == "none":
+        out[:] = block
+    elif filter == "shuffle":
+        unshuffle(block, dtype.itemsize, out)
+    elif filter == "delta":
+        undelta(block, dtype.itemsize, out)
+    elif filter == "xor":
+        unxor(unshuffle(block, dtype.itemsize, np.empty_like(block)), dtype.itemsize, lag, out)
+    else:
+        raise Exception("Unknown filter:", filter)
+    return out
+
+
+def shuffle(block, itemsize):
+    """Group the i-th byte of every item together.
+
+    >>> shuffle(np.array([1, 2], dtype="<u2").view(np.uint8), 2)
+    array([1, 2, 0, 0], dtype=uint8)
+    """
+    return block.reshape(-1, itemsize).T.reshape(-1)
+
+
+def unshuffle(block, itemsize, out):
+    out.reshape(-1, itemsize)[:] = block.reshape(itemsize, -1).T
+    return out
+
+
+def delta(block, itemsize):
+    """Differences between consecutive items, zigzag encoded so that small negative steps become small numbers.
+
+    >>> delta(np.array([5, 4, 6], dtype="<i2").view(np.uint8), 2).view("<u2")
+    array([10,  1,  4], dtype=uint16)
+    """
+    u = block.view(f"u{itemsize}")
+    d = np.empty_like(u)
+    d[:1] = u[:1]
+    np.subtract(u[1:], u[:-1], out=d[1:])
+    s = d.view(f"i{itemsize}")
+    return ((s << 1) ^ (s >> (8 * itemsize - 1))).view(np.uint8)
+
+
+def undelta(block, itemsize, out):
+    z = block.view(f"u{itemsize}")
+    d = (z >> 1) ^ (0 - (z & 1)).astype(z.dtype)
+    np.cumsum(d, dtype=z.dtype, out=out.view(f"u{itemsize}"))
+
+
+def xor(block, itemsize, lag):
+    """Each item XOR the item lag positions before it, like Gorilla does for consecutive floats of a time series.
+
+    Slowly varying values share sign, exponent and leading mantissa bits, which become zeros.
+    Encoding bit lengths per value would not vectorize, so the zeros are left for shuffle and the entropy coder.
+
+    >>> xor(np.array([1.0, 1.5, 1.25], dtype="<f8").view(np.uint8), 8, 1).view("<u8")[1:] >> 48
+    array([ 8, 12], dtype=uint64)
+    """
+    u = block.view(f"u{itemsize}")
+    x = u.copy()
+    np.bitwise_xor(u[lag:], u[:-lag], out=x[lag:])
+    return x.view(np.uint8)
+
+
+def unxor(block, itemsize, lag, out):
+    x, u = block.view(f"u{itemsize}"), out.view(f"u{itemsize}")
+    rows, rest = divmod(len(x), lag)
+    if rows == 0:
+        u[:] = x
+        return
+    full = rows * lag
+    np.bitwise_xor.accumulate(x[:full].reshape(rows, lag), axis=0, out=u[:full].reshape(rows, lag))
+    np.bitwise_xor(x[full:], u[full - lag:full - lag + rest], out=u[full:])
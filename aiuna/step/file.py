@@ -43,25 +43,38 @@
 
 import inspect
 import json
+from concurrent.futures import ProcessPoolExecutor
 # from functools import cached_property
 from aiuna.content.root import Root
-from aiuna.content.creation import read_arff, new
+from aiuna.content.creation import read_arff, read_csv
+from aiuna.content.parsing import uncompressed_name
+from aiuna.content.sidecar import sidecar
 from aiuna.step.new import New
 from akangatu.transf.dataindependentstep_ import DataIndependentStep_
 
 
 class File(DataIndependentStep_):
-    def __init__(self, name="iris.arff", path="./", hashes=None):
+    def __init__(self, name="iris.arff", path="./", hashes=None, cache=True):
+        """Dataset file as a step.
+
+        cache
+            Sidecar object to keep parsed files; True means the default one (see aiuna.content.sidecar),
+            False disables caching.
+        """
         self.isclass = False
         if not path.endswith("/"):
             print(path)
             raise Exception("Path should end with '/'", path)
-        if name.endswith(".arff"):
-            self._partial_config = {"name": name, "path": path}
-            self.filename = path + name
+        if uncompressed_name(name).endswith(".arff"):
+            self._read = read_arff
+        elif uncompressed_name(name).endswith(".csv"):
+            self._read = read_csv
         else:
             raise Exception("Unrecognized file extension:", name)
+        self._partial_config = {"name": name, "path": path}
+        self.filename = path + name
         self._hashes = hashes
+        self._sidecar = sidecar if cache is True else cache
         super().__init__(config_func=self._config)
 
     def _process_(self, data):
@@ -82,7 +95,13 @@ class File(DataIndependentStep_):
     ###@cached_property
     @property
     def data(self):
-        d = read_arff(self.filename)
+        return self._build(self._load())
+
+    def _load(self):
+        """Parse (or fetch from cache) the file content as a dict of matrices, hashes and metainfo."""
+        return self._sidecar.load(self.filename, self._read) if self._sidecar else self._read(self.filename)
+
+    def _build(self, d):
         ds = d["dataset"], d["description"], d["matrices"], d["original_hashes"]
         self._dataset, self._description, matrices, original_hashes = ds
         if self._hashes:
@@ -92,7 +111,7 @@ class File(DataIndependentStep_):
         else:
             self._hashes = original_hashes
 
-        return new(**matrices)
+        return New(original_hashes, **matrices).data  # Matrices are already hashed.
 
     ###@cached_property
     @property
@@ -125,6 +144,54 @@ class File(DataIndependentStep_):
     #     return "aiuna.step.file"
 
 
+def _parse(filename, read, sidecar):
+    """Parse a file inside a worker process; when cached, the parent will just memory map the stored matrices."""
+    if sidecar:
+        sidecar.load(filename, read)
+        return None
+    return read(filename)
+
+
+def files(names, path="./", workers=None, cache=True):
+    """Load many dataset files in parallel, parsing and hashing them in a pool of processes.
+
+    Parameters
+    ----------
+    names
+        File names, e.g., ["iris.arff", "abalone.arff"].
+    path
+        Common path, ending with '/'.
+    workers
+        Maximum number of simultaneous processes; all cores by default.
+    cache
+        See File.
+
+    Returns
+    -------
+    List of Data objects in the same order as names. A file that could not be loaded is represented by the
+    exception raised while loading it, so that one failure does not discard the rest.
+    """
+    steps, results = [], []
+    for name in names:
+        try:
+            steps.append(File(name, path, cache=cache))
+        except Exception as e:
+            steps.append(e)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [None if isinstance(step, Exception) else pool.submit(_parse, step.filename, step._read, step._sidecar)
+                   for step in steps]
+        for step, future in zip(steps, futures):
+            if future is None:
+                results.append(step)
+                continue
+            try:
+                d = future.result()
+                results.append(step.data if d is None else step._build(d))
+            except Exception as e:
+                results.append(e)
+    return results
+
+
 file = File()
 # TODO: autocomplete vai funcionar para args dos callable?
 
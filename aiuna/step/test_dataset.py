@@ -23,7 +23,8 @@
 from unittest import TestCase
 
 from aiuna.content.creation import mathash
-from aiuna.step.dataset import Dataset
+from aiuna.content.sidecar import read_json
+from aiuna.step.dataset import DATASETS, Dataset
 
 
 class TestDataset(TestCase):
@@ -31,3 +32,11 @@ class TestDataset(TestCase):
         d = Dataset().data
         self.assertEqual("19b2d27779bc2d2444c11f5cc24c98ee", mathash("X", d.X))
         self.assertEqual("8baa54c6c205d73f99bc1215b7d46c9c", mathash("y", d.y))
+
+    def test_asset(self):
+        d = Dataset("abalone").data
+        meta = read_json(DATASETS + "/abalone/meta.json")
+        self.assertEqual((4177, 8), d.X.shape)
+        self.assertEqual(meta["original_hashes"]["X"], mathash("X", d.X))
+        self.assertEqual(meta["matrices"]["Yt"], d.Yt)
+        self.assertRaises(Exception, Dataset, "zstd")  # Not every directory under assets is a dataset.
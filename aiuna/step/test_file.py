@@ -0,0 +1,58 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+import numpy as np
+
+from aiuna.content.sidecar import Sidecar
+from aiuna.step.file import File, files
+
+ARFF = """@relation toy{0}
+@attribute a numeric
+@attribute k {{p,q}}
+@data
+{0},p
+1.5,q
+"""
+
+
+class TestFile(TestCase):
+    def test_files(self):
+        with TemporaryDirectory() as tmp:
+            path = tmp + "/"
+            for i in range(3):
+                with open(os.path.join(tmp, f"toy{i}.arff"), "w") as f:
+                    f.write(ARFF.format(i))
+            names = ["toy2.arff", "missing.arff", "toy0.arff", "toy.txt", "toy1.arff"]
+            expected = [File(name, path, cache=False).data for name in ["toy2.arff", "toy0.arff", "toy1.arff"]]
+            for cache in [False, Sidecar(os.path.join(tmp, "cache"))]:
+                for _ in range(2):  # Cold and warm cache.
+                    results = files(names, path, workers=2, cache=cache)
+                    self.assertIsInstance(results[1], FileNotFoundError)
+                    self.assertIsInstance(results[3], Exception)
+                    for d, e in zip([results[0], results[2], results[4]], expected):
+                        self.assertEqual(e.uuid, d.uuid)
+                        np.testing.assert_array_equal(e.X, d.X)
+                self.assertEqual([2.0, 0.0, 1.0], [d.X[0, 0] for d in results[::2]])
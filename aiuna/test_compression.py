@@ -0,0 +1,205 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from os.path import dirname, join
+from tempfile import TemporaryDirectory, TemporaryFile
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+import orjson
+import zstandard as zs
+
+from aiuna import compression
+from aiuna.compression import DICTIONARIES, HashableBinary, PackCache, build_dictionary, choose, compression_dict, \
+    dump, load, memopack, pack, pack_array, pack_labels, retrain, unpack, unpack_array, unpack_labels
+
+
+class TestCompression(TestCase):
+    def test_arrays(self):
+        rng = np.random.default_rng(0)
+        for a in [rng.random((100, 7)), rng.random((100, 7)).T, np.arange(10, dtype=np.int8),
+                  np.array([-2**63, 2**63 - 1, 0, -1, 5]), np.arange(100, dtype=">u4")[::-1],
+                  np.array(["a", "bc"]), np.zeros((0, 3)), np.array(3.5)]:
+            b = unpack(pack(a))
+            self.assertEqual(a.dtype, b.dtype)
+            self.assertEqual(a.shape, b.shape)
+            self.assertTrue(np.array_equal(a, b))
+            for filter in ["none", "shuffle", "delta"] if a.dtype.kind in "iu" else \
+                    ["none", "shuffle", "xor"] if a.dtype.kind == "f" else ["none", "shuffle"]:
+                self.assertTrue(np.array_equal(a, unpack_array(pack_array(a, block_bytes=30, filter=filter))))
+
+    def test_structured(self):
+        nested = [(("title", "a"), "i4"), ("b", "f8", (2, 3)), ("c", [("x", "u1"), ("y", "U3")])]
+        for dtype in [[("a", "i4"), ("b", "f8")], nested,
+                      {"names": ["a"], "formats": ["i2"], "offsets": [4], "itemsize": 8}]:
+            a = np.zeros(10, dtype=dtype)
+            a[a.dtype.names[0]] = np.arange(10)
+            for b in [unpack(pack(a)), unpack_array(pack_array(a, block_bytes=30, filter="shuffle"))]:
+                self.assertEqual(a.dtype, b.dtype)
+                self.assertEqual(a.tobytes(), b.tobytes())
+            f = BytesIO()
+            dump(a, f, block_bytes=30)
+            f.seek(0)
+            self.assertEqual(a.dtype, load(f).dtype)
+
+    def test_objects(self):
+        for obj in [{"b": [1, 2.5, None], "a": "x"}, [], "texto", b"\x00\x01" * 50, 7, {1, 2},
+                    np.array(["a", None], dtype=object)]:
+            b = unpack(pack(obj))
+            if isinstance(obj, np.ndarray):
+                self.assertEqual(list(obj), list(b))
+            else:
+                self.assertEqual(obj, b)
+
+    def test_legacy(self):
+        self.assertEqual({"a": [1, 2]}, unpack(orjson.dumps({"a": [1, 2]})))
+
+    def test_smaller(self):
+        X = np.random.default_rng(0).integers(0, 100, (1000, 20)).astype(float)
+        self.assertLess(len(pack(X)), len(orjson.dumps(X, option=orjson.OPT_SERIALIZE_NUMPY)))
+
+    def test_dictionary(self):
+        steps = [{"id": f"{i:023}", "desc": {"name": "Split", "path": "kururu.tool.evaluation.split",
+                                             "config": {"mode": "holdout", "test_size": i / 1000, "seed": i % 7}}}
+                 for i in range(500)]
+        dump = pack(steps[:3])
+        self.assertEqual(compression_dict().dict_id(), zs.get_frame_parameters(dump[2:]).dict_id)
+        with ThreadPoolExecutor(4) as pool:  # Contexts are reused, but never shared between threads.
+            self.assertEqual(steps, list(pool.map(unpack, pool.map(pack, steps))))
+        with TemporaryDirectory() as tmp:
+            self.assertEqual(2, retrain([orjson.dumps(s) for s in steps], tmp, dict_size=4096))
+            self.assertEqual(3, retrain(map(pack, steps), tmp, dict_size=4096))
+            self.assertEqual(1, zs.get_frame_parameters(pack(steps[:3])[2:]).dict_id)  # Not used unless pinned.
+            with patch.object(compression, "DICT_ID", 3), patch.object(compression, "DICT_DIRS", [DICTIONARIES, tmp]):
+                dump = pack(steps[:3])
+                self.assertEqual(3, zs.get_frame_parameters(dump[2:]).dict_id)
+                self.assertEqual(steps[:3], unpack(dump))
+            compression_dict.cache_clear()
+
+    def test_build_dictionary(self):
+        with TemporaryDirectory() as tmp, open(join(DICTIONARIES, "1.dict"), "rb") as f:
+            build_dictionary(tmp)
+            with open(join(tmp, "1.dict"), "rb") as g:
+                self.assertEqual(f.read(), g.read())
+
+    def test_memopack(self):
+        X = np.random.default_rng(0).random((100, 10))
+        cache = PackCache(budget=2 * len(pack(X)))
+        dump = memopack(HashableBinary(1, X), cache)
+        self.assertIs(dump, memopack(HashableBinary(1, X), cache))
+        self.assertEqual((1, 1), (cache.hits, cache.misses))
+        memopack(HashableBinary(2, X), cache)
+        memopack(HashableBinary(1, X), cache)
+        memopack(HashableBinary(3, X), cache)  # evicts 2, the least recently used
+        self.assertEqual(2, len(cache))
+        self.assertLessEqual(cache.size, cache.budget)
+        self.assertIsNone(cache.get(2))
+
+    def test_blocks(self):
+        X = np.random.default_rng(0).integers(0, 9, (1000, 37)).astype(float)
+        dump = pack_array(X, block_bytes=1000, threads=1)
+        for codec in ["zstd", "lz4"]:
+            self.assertEqual(pack_array(X, codec, 1000, 1), pack_array(X, codec, 1000, 4))
+        self.assertTrue(np.array_equal(X, unpack_array(dump, threads=3)))
+
+    def test_filters(self):
+        rng = np.random.default_rng(0)
+        X = np.cumsum(rng.normal(size=(10000, 10)), axis=0)
+        idx = np.flatnonzero(rng.random(100000) < 0.3)
+        codes = rng.integers(0, 3, 10000)
+        self.assertLess(len(pack_array(X, "zstd", filter="shuffle")), len(pack_array(X, "zstd", filter="none")))
+        self.assertLess(len(pack_array(idx, "zstd", filter="delta")), len(pack_array(idx, "zstd", filter="none")))
+        self.assertLess(len(pack_array(codes, "zstd", filter="shuffle")), len(pack_array(codes, "zstd", filter="none")))
+        t = np.linspace(0, 100, 20000)
+        sensors = np.column_stack([20 + np.sin(t), 1000 + t ** 1.5, np.exp(-t / 50)])
+        self.assertLess(len(pack_array(sensors, "zstd", filter="xor")) * 1.3, len(pack_array(sensors, "zstd", filter="none")))
+        self.assertEqual("xor", choose(sensors, policy="smallest")[1])
+
+    def test_zerocopy(self):
+        X = np.random.default_rng(0).random((1000, 7))
+        for codec in ["zstd", "lz4", "raw"]:
+            Z = unpack(b"\xa1A" + pack_array(X, codec, block_bytes=1000, offset=2))
+            self.assertTrue(np.array_equal(X, Z))
+            self.assertFalse(Z.flags.writeable)
+            if codec != "raw":
+                self.assertEqual(0, Z.ctypes.data % 64)
+        with TemporaryFile() as f:
+            f.write(b"\xa1A" + pack_array(X, "raw", offset=2))
+            f.flush()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                Z = unpack(m)
+                self.assertTrue(np.array_equal(X, Z))
+                self.assertEqual(0, Z.ctypes.data % 64)
+                self.assertTrue(np.shares_memory(Z, np.frombuffer(m, dtype=np.uint8)))
+                del Z
+
+    def test_stream(self):
+        X = np.random.default_rng(0).random((1000, 7))
+        for obj in [X, X.T, np.arange(1000), np.zeros((0, 3)), {"a": [1]}, "text"]:
+            f = BytesIO()
+            dump(obj, f, block_bytes=1000, threads=2)
+            f.seek(0)
+            obj2 = load(f, threads=3)
+            self.assertTrue(np.array_equal(obj, obj2) if isinstance(obj, np.ndarray) else obj == obj2)
+        f = BytesIO()
+        dump(X, f, codec="lz4", block_bytes=1000)
+        with TemporaryDirectory() as tmp:
+            f.seek(0)
+            Z = load(f, out=join(tmp, "X.mmap"))
+            self.assertIsInstance(Z, np.memmap)
+            self.assertTrue(np.array_equal(X, Z))
+            del Z
+
+    def test_choose(self):
+        rng = np.random.default_rng(0)
+        noise, idx = rng.random(100000), np.flatnonzero(rng.random(100000) < 0.3)
+        self.assertEqual("raw", choose(noise, policy="fastest")[0])
+        self.assertEqual("delta", choose(idx, policy="smallest")[1])
+        self.assertEqual(("lz4", "none"), choose(np.zeros(100000), policy="fastest"))
+        for a in [noise, idx, np.load(join(dirname(__file__), "assets", "datasets", "abalone", "X.npy"))]:
+            smallest = len(pack_array(a, policy="smallest"))
+            for codec in ["zstd", "lz4", "raw"]:
+                self.assertLessEqual(smallest, len(pack_array(a, codec, policy="smallest")) * 1.01)
+
+    def test_labels(self):
+        rng = np.random.default_rng(0)
+        y = rng.choice(["Iris-setosa", "Iris-versicolor", "Iris-virginica"], 100000)
+        dump = pack(y)
+        self.assertEqual(b"L", dump[1:2])
+        self.assertLess(len(dump), len(y) / 4)
+        self.assertTrue(np.array_equal(y, unpack(dump)))
+        categories, codes = unpack_labels(pack_labels(y), codes=True)
+        self.assertTrue(np.array_equal(y, np.array(categories)[codes]))
+        for a in [np.array(["b", None, "a", "b"], dtype=object).reshape(2, 2), np.array(["x"] * 9), y[:1000].reshape(10, 100)]:
+            b = unpack(pack(a))
+            self.assertEqual((a.dtype, a.shape), (b.dtype, b.shape))
+            self.assertTrue(np.array_equal(a, b))
+            self.assertFalse(b.flags.writeable)
+        self.assertEqual(b"A", pack(np.arange(70000).astype(str))[1:2])
+        self.assertFalse(unpack(pack(np.array(["x", 1], dtype=object))).flags.writeable)
+        labels = np.array(["b", None, "a", "b", None], dtype=object)
+        categories, codes = unpack_labels(pack_labels(labels), codes=True)
+        self.assertEqual((["b", "a", None], [0, 2, 1, 0, 2]), (categories, codes.tolist()))
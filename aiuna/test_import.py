@@ -0,0 +1,39 @@
+#  Copyright (c) 2020. Davi Pereira dos Santos
+#  This file is part of the aiuna project.
+#  Please respect the license - more about this in the section (*) below.
+#
+#  aiuna is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  aiuna is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with aiuna.  If not, see <http://www.gnu.org/licenses/>.
+#
+#  (*) Removing authorship by any means, e.g. by distribution of derived
+#  works or verbatim, obfuscated, compiled or rewritten versions of any
+#  part of this work is a crime and is unethical regarding the effort and
+#  time spent here.
+#  Relevant employers or funding agencies will be notified accordingly.
+import subprocess
+import sys
+from unittest import TestCase
+
+# Cold 'import aiuna' should stay well below this (in seconds), as it must not load heavy dependencies.
+IMPORT_TARGET = 0.5
+HEAVY = ["sklearn", "pandas", "arff", "lz4", "zstandard", "aiuna.step.dataset"]
+
+
+class TestImport(TestCase):
+    def test_cold_import(self):
+        code = ("import sys, time; t = time.perf_counter(); import aiuna; t = time.perf_counter() - t; "
+                f"print(t, *[m for m in {HEAVY} if m in sys.modules])")
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                             check=True).stdout.split()
+        self.assertEqual([], out[1:], "Heavy modules loaded by 'import aiuna'.")
+        self.assertLess(float(out[0]), IMPORT_TARGET)
@@ -9,9 +9,12 @@ print(d.Xd)
 print(d.X[:5])
 # ...
 
-print(d.y[:5])
+print(d.y[:5])  # Nominal values are stored as codes.
 # ...
 
-from pandas import DataFrame
-print(DataFrame(d.y).value_counts())
+print(d.Yt)
+# ...
+
+from pandas import Categorical
+print(Categorical.from_codes(d.y, d.Yt[0]).value_counts())
 # ...
@@ -51,7 +51,7 @@ CLASSIFIERS = ['Intended Audience :: Science/Research',
                'Programming Language :: Python :: 3.8']
 
 INSTALL_REQUIRES = [
-    'numpy', 'liac-arff', "lz4", "zstandard", "pandas", "sklearn", "more_itertools", "akangatu",
+    'numpy', 'liac-arff>=2.4,<2.6', "lz4", "zstandard", "pandas", "sklearn", "more_itertools", "akangatu",
     'orjson'
 ]
 
@@ -60,6 +60,8 @@ EXTRAS_REQUIRE = {
 
 SETUP_REQUIRES = ['wheel']
 
+PACKAGE_DATA = {'aiuna': ['assets/zstd/*', 'assets/datasets/*/*']}
+
 setuptools.setup(
     name=NAME,
     version=VERSION,
@@ -74,6 +76,7 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     license=LICENSE,
     packages=setuptools.find_packages(),
+    package_data=PACKAGE_DATA,
     setup_requires=SETUP_REQUIRES,
     url=URL,
 )